@@ -1,27 +1,38 @@
 # Restore svg_wave function above its first usage
 from __future__ import annotations
-from jinja2 import DictLoader, Environment, select_autoescape
-import base64
+from jinja2 import (DictLoader, Environment, FileSystemBytecodeCache, Template,
+                    select_autoescape)
+import functools
 import hashlib
+import io
 import json
 import os
 import re
 import shutil
 import sys
 import tempfile
-import urllib.error
 import urllib.parse
-import urllib.request
 import uuid
-import webbrowser
-import zipfile
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, cast
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtCore import QObject, QThread, Qt, QUrl, pyqtSignal, QTimer, QPropertyAnimation
 from PyQt6.QtGui import QCloseEvent, QDesktopServices, QPixmap
+
+from webineer_common import (
+    PreviewVisibilityMixin,
+    adopt_str_fields,
+    atomic_write,
+    content_digest,
+    fits_set_html,
+    render_template,
+    snapshot_copy,
+    write_base64_asset,
+    write_if_changed,
+)
 # Try multimedia; allow graceful fallback
 try:
     from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
@@ -29,9 +40,37 @@ try:
     _WEBINEER_AUDIO_OK = True
 except Exception:
     _WEBINEER_AUDIO_OK = False
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+# Optional SIMD base64 for image payloads; same API as the stdlib module
+try:
+    import pybase64 as base64  # type: ignore
+except Exception:
+    import base64
+# Optional fast JSON; the stdlib module is used when it is missing
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+# Optional binary project format
+try:
+    import msgpack  # type: ignore
+except Exception:
+    msgpack = None  # type: ignore
+if TYPE_CHECKING:
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+
+def new_web_view(parent: Optional[QtWidgets.QWidget] = None) -> "QWebEngineView":
+    """Create a QWebEngineView, loading Qt WebEngine on first use.
+
+    Importing it pulls in Chromium, so it is deferred until a preview is
+    built; main() sets AA_ShareOpenGLContexts so a late import is allowed.
+    """
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+    return QWebEngineView(parent)
 
 
+@functools.lru_cache(maxsize=None)
 def svg_wave(fill: str = "#e2e8f0") -> str:
 
     path = (
@@ -162,11 +201,18 @@ def _tune_design_layouts(root_widget: QtWidgets.QWidget) -> None:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def _app_icon() -> Optional[QtGui.QIcon]:
+    icon_path = Path(APP_ICON_PATH)
+    return QtGui.QIcon(str(icon_path)) if icon_path.exists() else None
+
+
 def ensure_app_icon(widget: QtWidgets.QWidget) -> None:
     """Attempt to set the app icon on a widget."""
-    icon_path = Path(APP_ICON_PATH)
-    if icon_path.exists():
-        widget.setWindowIcon(QtGui.QIcon(str(icon_path)))
+    # Every dialog calls this; the icon is loaded from disk only once.
+    icon = _app_icon()
+    if icon is not None:
+        widget.setWindowIcon(icon)
 
 
 def open_url(url: str) -> None:
@@ -177,13 +223,24 @@ def open_url(url: str) -> None:
             return
     except Exception:
         pass
+    import webbrowser
+
     webbrowser.open(url)
 
 
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+_PROJECT_SLUG_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+
+
+def project_file_slug(name: str) -> str:
+    """File stem for a new ``.siteproj`` named after the site."""
+    return _PROJECT_SLUG_RE.sub("-", name.lower()).strip("-") or "site"
+
+
 def slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
 
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "section"
+    return _SLUG_SEPARATOR_RE.sub("-", text.lower()).strip("-") or "section"
 
 
 def app_base_dir() -> Path:
@@ -216,9 +273,62 @@ PREVIEWS_DIR = app_data_dir() / "Previews"
 PREVIEWS_DIR.mkdir(parents=True, exist_ok=True)
 COVERS_DIR = PREVIEWS_DIR / "Covers"
 COVERS_DIR.mkdir(parents=True, exist_ok=True)
+TEMPLATE_CACHE_DIR = app_data_dir() / "TemplateCache"
 COVER_FULL_SIZE = QtCore.QSize(1280, 800)
 COVER_TILE_SIZE = QtCore.QSize(420, 260)
 
+
+def json_dumps_bytes(obj: object, *, indent: bool = False,
+                     sort_keys: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON, through orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys,
+                      ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, through orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# path -> (st_mtime_ns, st_size, parsed value) of the last read or write.
+_JSON_FILE_CACHE: Dict[Path, Tuple[int, int, Any]] = {}
+
+
+def read_json_file(path: Path) -> Any:
+    """Parse the JSON file at ``path``, reusing the last parse if unchanged.
+
+    The file is only re-read when its mtime or size moved. The returned
+    value is shared with the cache, so callers copy it before mutating.
+    Raises ``OSError`` for a missing file and ``ValueError`` for bad JSON.
+    """
+    st = path.stat()
+    cached = _JSON_FILE_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    value = json_loads(path.read_bytes())
+    _JSON_FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, value)
+    return value
+
+
+def write_json_file(path: Path, value: Any) -> None:
+    """Write ``value`` as compact JSON and remember it for read_json_file.
+
+    The file is written beside ``path`` and renamed over it, so readers never
+    see a partial document. ``value`` is kept as the cached parse, so pass an
+    object that will not be mutated afterwards.
+    """
+    data = json_dumps_bytes(value)
+    atomic_write(path, lambda fh: fh.write(data))
+    st = path.stat()
+    _JSON_FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, value)
+
 # Application build/version marker used to decide when to reset app data on upgrade
 BUILD_VERSION = "1.0.0"
 INSTALL_MARK = app_data_dir() / ".installed_version"
@@ -387,23 +497,26 @@ def hide_splash_with_fade(
     setattr(splash, "_fade_out_anim", anim)
 
 
+# Settings changed in quick succession are written to disk once; a write
+# that fails is retried after the longer delay.
+SETTINGS_SAVE_DELAY_MS = 250
+SETTINGS_RETRY_DELAY_MS = 5000
+
+
 class SettingsManager:
     """Very small settings helper storing JSON data."""
 
     def __init__(self) -> None:
         self._settings: Dict[str, str] = {}
+        self._save_pending = False
+        self._flush_on_quit = False
         self.load()
 
     def load(self) -> None:
         changed = False
-        if SETTINGS_PATH.exists():
-            try:
-                self._settings = json.loads(
-                    SETTINGS_PATH.read_text(
-                        encoding="utf-8"))
-            except Exception:
-                self._settings = {}
-        else:
+        try:
+            self._settings = dict(read_json_file(SETTINGS_PATH))
+        except Exception:
             self._settings = {}
 
         if self._settings.get("show_splash", "") == "":
@@ -427,18 +540,44 @@ class SettingsManager:
                 pass
 
     def save(self) -> None:
-        SETTINGS_PATH.write_text(
-            json.dumps(
-                self._settings,
-                indent=2),
-            encoding="utf-8")
+        write_json_file(SETTINGS_PATH, dict(self._settings))
 
     def get(self, key: str, default: str = "") -> str:
         return self._settings.get(key, default)
 
     def set(self, key: str, value: str) -> None:
+        if self._settings.get(key) == value:
+            return
         self._settings[key] = value
+        app = QtCore.QCoreApplication.instance()
+        if app is None:
+            self.save()
+            return
+        if not self._flush_on_quit:
+            app.aboutToQuit.connect(self._flush_pending)
+            self._flush_on_quit = True
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(SETTINGS_SAVE_DELAY_MS, self._flush_pending)
+
+    def flush(self) -> None:
+        """Write settings changed by set() that are still waiting.
+
+        Errors propagate, and the changes stay pending until a write succeeds.
+        """
+        if not self._save_pending:
+            return
         self.save()
+        self._save_pending = False
+
+    def _flush_pending(self) -> None:
+        # Timer and aboutToQuit slot: an exception escaping a slot would
+        # abort the app, so a failed write is reported and retried instead.
+        try:
+            self.flush()
+        except OSError as exc:
+            QtCore.qWarning(f"Could not save settings to {SETTINGS_PATH}: {exc}")
+            QTimer.singleShot(SETTINGS_RETRY_DELAY_MS, self._flush_pending)
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -451,6 +590,26 @@ class Page:
     title: str
     html: str
 
+    def to_dict(self) -> Dict[str, object]:
+        return {"filename": self.filename, "title": self.title, "html": self.html}
+
+    @staticmethod
+    def from_dict(data: Dict[str, object]) -> "Page":
+        return Page(
+            filename=str(data.get("filename", "")),
+            title=str(data.get("title", "")),
+            html=str(data.get("html", "")),
+        )
+
+    @staticmethod
+    def _adopt(data: Dict[str, object]) -> "Page":
+        """Build a Page that takes ownership of a freshly parsed dict.
+
+        Malformed entries go through ``from_dict``; see ``adopt_str_fields``.
+        """
+        page = adopt_str_fields(Page, data)
+        return page if page is not None else Page.from_dict(data)
+
 
 @dataclass
 class AssetImage:
@@ -585,6 +744,9 @@ MOTION_PREF_OPTIONS: Dict[str, str] = {
     "Force on": "force_on",
     "Force off": "force_off",
 }
+# Reverse lookups for restoring combo labels from stored project values.
+MOTION_EASING_LABELS = {value: label for label, value in MOTION_EASINGS.items()}
+MOTION_PREF_LABELS = {value: label for label, value in MOTION_PREF_OPTIONS.items()}
 
 
 @dataclass
@@ -619,10 +781,21 @@ class Project:
     cover_asset_name: Optional[str] = None
     cover_tile_path: Optional[str] = None
 
+    def snapshot(self) -> "Project":
+        """Return a copy for background work that the UI can keep editing."""
+        clone = snapshot_copy(
+            self, lists=("pages", "images", "external"),
+            dicts=("palette", "fonts", "gradients"))
+        clone.backgrounds = [
+            BackgroundSpec(scope=bg.scope, kind=bg.kind, value=dict(bg.value))
+            for bg in self.backgrounds
+        ]
+        return clone
+
     def to_dict(self) -> Dict[str, object]:
         return {
             "name": self.name,
-            "pages": [asdict(p) for p in self.pages],
+            "pages": [p.to_dict() for p in self.pages],
             "css": self.css,
             "palette": self.palette,
             "fonts": self.fonts,
@@ -674,7 +847,9 @@ class Project:
         version = safe_int(data.get("version", 1))
         if version == 1:
             data = migrate_project_v1_to_v2(data)
-        pages = [Page(**p) for p in safe_list(data.get("pages", []))]
+        pages = [
+            Page._adopt(p) for p in safe_list(data.get("pages", []))
+            if isinstance(p, dict)]
         images = [
             AssetImage.from_dict(img) for img in safe_list(
                 data.get(
@@ -875,6 +1050,9 @@ TEMPLATE_EXTRA_SENTINEL = "/* === WEBINEER TEMPLATE EXTRA CSS === */"
 BACKGROUND_BLOCK_START = "/* === WEBINEER BACKGROUNDS START === */"
 BACKGROUND_BLOCK_END = "/* === WEBINEER BACKGROUNDS END === */"
 BACKGROUND_COMMENT_PREFIX = "/* Webineer Background"
+_BACKGROUND_BLOCK_RE = re.compile(
+    re.escape(BACKGROUND_BLOCK_START) + r".*?" +
+    re.escape(BACKGROUND_BLOCK_END), re.S)
 
 CSS_HELPERS_BLOCK = """:root {
   --space-0: 0;
@@ -1182,11 +1360,20 @@ BG_HELPERS_BLOCK = """{BG_HELPERS_SENTINEL}
 def gradient_helpers_block(grad: Dict[str, str]) -> str:
     """Return the gradient helper CSS block."""
 
+    return _gradient_helpers_block(
+        str(grad.get('from', '#3b82f6')),
+        str(grad.get('to', '#60a5fa')),
+        str(grad.get('angle', '135deg')),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _gradient_helpers_block(grad_from: str, grad_to: str, angle: str) -> str:
     return f"""{GRADIENT_HELPERS_SENTINEL}
 :root {{
-  --gradient-from: {grad.get('from', '#3b82f6')};
-  --gradient-to: {grad.get('to', '#60a5fa')};
-  --gradient-angle: {grad.get('angle', '135deg')};
+  --gradient-from: {grad_from};
+  --gradient-to: {grad_to};
+  --gradient-angle: {angle};
   --gradient-main: linear-gradient(var(--gradient-angle), var(--gradient-from), var(--gradient-to));
 }}
 .bg-gradient {{ background: var(--gradient-main); }}
@@ -1196,6 +1383,7 @@ def gradient_helpers_block(grad: Dict[str, str]) -> str:
 """
 
 
+@functools.lru_cache(maxsize=None)
 def animation_helpers_block(motion_pref: str = "respect") -> str:
     """Return the animation helper CSS block."""
 
@@ -1266,6 +1454,7 @@ CSS_SENTINELS = (
     ANIM_HELPERS_SENTINEL,
     TEMPLATE_EXTRA_SENTINEL,
 )
+_CSS_SENTINEL_RE = re.compile("|".join(re.escape(s) for s in CSS_SENTINELS))
 
 
 def ensure_block(css: str, sentinel: str, block: str) -> str:
@@ -1274,33 +1463,105 @@ def ensure_block(css: str, sentinel: str, block: str) -> str:
     if sentinel in css:
         return css
     base = css.rstrip()
-    block_content = block.strip()
-    if block_content.startswith(sentinel):
-        block_content = block_content[len(sentinel):].lstrip("\n")
-    addition = f"{sentinel}\n{block_content}\n" if block_content else f"{sentinel}\n"
+    addition = _block_addition(sentinel, block)
     if base:
         return base + "\n\n" + addition
     return addition
 
 
+@functools.lru_cache(maxsize=64)
+def _block_addition(sentinel: str, block: str) -> str:
+    """Normalise ``block`` to the text ``ensure_block`` appends.
+
+    The helper blocks are module constants or cached per setting, so each
+    one is stripped and prefixed once rather than on every CSS rebuild.
+    """
+    block_content = block.strip()
+    if block_content.startswith(sentinel):
+        block_content = block_content[len(sentinel):].lstrip("\n")
+    return f"{sentinel}\n{block_content}\n" if block_content else f"{sentinel}\n"
+
+
+def ensure_blocks(
+    css: str,
+    blocks: Iterable[Tuple[str, str]],
+    present: Optional[Iterable[str]] = None,
+) -> str:
+    """Apply ``ensure_block`` for each ``(sentinel, block)`` with one join.
+
+    Chained ``ensure_block`` calls copy the whole stylesheet once per
+    appended block; this builds the same text in a single allocation.
+    ``present`` may name the sentinels already known to be in ``css`` so
+    the stylesheet is not rescanned.
+    """
+
+    known = set(present) if present is not None else None
+    additions: List[str] = []
+    for sentinel, block in blocks:
+        if known is not None:
+            if sentinel in known:
+                continue
+        elif sentinel in css:
+            continue
+        if any(sentinel in addition for addition in additions):
+            continue
+        additions.append(_block_addition(sentinel, block))
+    if not additions:
+        return css
+    parts = [part.rstrip() for part in (css, *additions)]
+    return "\n\n".join(part for part in parts if part) + "\n"
+
+
 def extract_css_block(css: str, sentinel: str) -> str | None:
     """Return the CSS content for a sentinel without the sentinel line."""
 
-    if sentinel not in css:
+    start = css.find(sentinel)
+    if start == -1:
         return None
-    tail = css.split(sentinel, 1)[1].lstrip('\n')
-    end = len(tail)
-    for other in CSS_SENTINELS:
-        if other == sentinel:
-            continue
-        pos = tail.find(other)
-        if pos != -1 and pos < end:
-            end = pos
-    block = tail[:end].strip()
+    start += len(sentinel)
+    end = len(css)
+    for match in _CSS_SENTINEL_RE.finditer(css, start):
+        if match.group() != sentinel:
+            end = match.start()
+            break
+    block = css[start:end].strip()
     return block or None
 
 
+def split_css_blocks(css: str) -> Dict[str, str]:
+    """Return every sentinel block in ``css`` from a single scan.
+
+    ``split_css_blocks(css).get(sentinel) or None`` matches
+    ``extract_css_block(css, sentinel)``.
+    """
+
+    matches = list(_CSS_SENTINEL_RE.finditer(css))
+    blocks: Dict[str, str] = {}
+    for i, match in enumerate(matches):
+        sentinel = match.group()
+        if sentinel in blocks:
+            continue
+        end = len(css)
+        for following in matches[i + 1:]:
+            if following.group() != sentinel:
+                end = following.start()
+                break
+        blocks[sentinel] = css[match.end():end].strip()
+    return blocks
+
+
+@functools.lru_cache(maxsize=4)
+def _shared_css_blocks(css: str) -> Dict[str, str]:
+    """``split_css_blocks`` for the project stylesheet; treat as read-only.
+
+    The project keeps the same ``css`` string until it is edited, so repeat
+    previews hit the cache on identity instead of rescanning the text.
+    """
+    return split_css_blocks(css)
+
+
 THEME_EXTRA_PREFIX = "/* theme:"
+_THEME_EXTRA_RE = re.compile(r"/\* theme:.*?\*/.*?(?=(/\* theme:)|$)", re.S)
 
 
 def strip_theme_extras(block: Optional[str]) -> str:
@@ -1308,9 +1569,7 @@ def strip_theme_extras(block: Optional[str]) -> str:
 
     if not block:
         return ""
-    pattern = re.compile(r"/\* theme:.*?\*/.*?(?=(/\* theme:)|$)", re.S)
-    cleaned = re.sub(pattern, "", block)
-    return cleaned.strip()
+    return _THEME_EXTRA_RE.sub("", block).strip()
 
 
 MAIN_JS_SNIPPET = """// Lightweight helpers for Webineer components
@@ -1368,7 +1627,7 @@ SCROLL_JS_SNIPPET = """// Minimal intersection observer for scroll animations
 """
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Snippet:
     label: str
     html: str
@@ -1912,58 +2171,92 @@ class ColorButton(QtWidgets.QPushButton):
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_hero() -> str:
     return LAYOUT_SNIPPETS["hero-spotlight"].html.strip()
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_two_column() -> str:
     return """<section class=\"section\">\n  <div class=\"grid split-2\">\n    <article class=\"stack\">\n      <p class=\"eyebrow\">Why choose us</p>\n      <h2>Share a concise benefit</h2>\n      <p>Use this space to explain how you help visitors solve their problem or reach a goal.</p>\n      <div class=\"stack-inline\">\n        <a class=\"btn btn-primary\" href=\"#\">Primary action</a>\n        <a class=\"btn btn-ghost\" href=\"#\">Learn more</a>\n      </div>\n    </article>\n    <article class=\"card media\">\n      <img src=\"assets/images/placeholder-wide.png\" alt=\"Screenshot preview\">\n    </article>\n  </div>\n</section>"""
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_features() -> str:
     return """<section class=\"section\">\n  <h2>Highlights</h2>\n  <div class=\"grid split-3\">\n    <article class=\"card\">\n      <h3>Fast onboarding</h3>\n      <p>Walk newcomers through the essentials in minutes.</p>\n    </article>\n    <article class=\"card\">\n      <h3>Thoughtful design</h3>\n      <p>Clean layouts keep attention on your message.</p>\n    </article>\n    <article class=\"card\">\n      <h3>Built to grow</h3>\n      <p>Swap or add sections as your story evolves.</p>\n    </article>\n  </div>\n</section>"""
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_cta() -> str:
     return """<section class=\"section center\">\n  <div class=\"card stack center\">\n    <h2>Ready to get started?</h2>\n    <p class=\"lead\">Invite visitors to take the next step with a clear promise.</p>\n    <div class=\"stack-inline\">\n      <a class=\"btn btn-primary\" href=\"#\">Start now</a>\n      <a class=\"btn btn-ghost\" href=\"#\">Talk to us</a>\n    </div>\n  </div>\n</section>"""
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_faq() -> str:
     return """<section class=\"section max-w-lg\">\n  <h2>Frequently asked questions</h2>\n  <details class=\"faq\">\n    <summary>What should visitors know first?</summary>\n    <p>Answer with a friendly sentence or two. Keep it simple and actionable.</p>\n  </details>\n  <details class=\"faq\">\n    <summary>How long does setup take?</summary>\n    <p>Most teams publish in under a day—drag, drop, and refine.</p>\n  </details>\n  <details class=\"faq\">\n    <summary>Can I update content later?</summary>\n    <p>Absolutely. Add new sections and tweak copy whenever inspiration strikes.</p>\n  </details>\n</section>"""
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_pricing() -> str:
     return SECTIONS_SNIPPETS["pricing"].html.strip()
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_testimonials() -> str:
     return SECTIONS_SNIPPETS["testimonials"].html.strip()
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_gallery() -> str:
     return SECTIONS_SNIPPETS["gallery"].html.strip()
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_contact_form() -> str:
     return SECTIONS_SNIPPETS["contact"].html.strip()
 
 
+@functools.lru_cache(maxsize=None)
 def html_section_about_header() -> str:
     return """<section class=\"section max-w-lg\">\n  <p class=\"eyebrow\">About</p>\n  <h1>Meet the team behind your next big win</h1>\n  <p class=\"lead\">Share your mission, values, and the milestones that make your story memorable.</p>\n</section>"""
 
 
+@functools.lru_cache(maxsize=None)
 def svg_blob(color: str = "#e5e7eb") -> str:
     return f"""<svg viewBox=\"0 0 600 400\" xmlns=\"http://www.w3.org/2000/svg\" width=\"100%\" height=\"100%\" preserveAspectRatio=\"none\">\n  <path fill=\"{color}\" d=\"M92.4,-111.4C126.6,-86.1,162.9,-64.6,185.5,-31.5C208,1.6,216.9,46.3,199.6,85.9C182.3,125.4,138.9,159.8,93.5,176.8C48.2,193.9,1,193.7,-46.2,188.6C-93.4,183.4,-140.6,173.2,-171.8,141.6C-203,110,-218.3,57.1,-213.4,7.2C-208.5,-42.6,-183.4,-89.6,-148.9,-116.1C-114.5,-142.6,-70.8,-148.7,-31.7,-141.8C7.4,-134.8,14.8,-114.8,92.4,-111.4Z\" transform=\"translate(300 200)\"/>\n</svg>"""
 
 
+@functools.lru_cache(maxsize=None)
 def svg_dots(bg: str = "#ffffff", dot: str = "#e5e7eb") -> str:
     return f"""<svg viewBox=\"0 0 400 200\" xmlns=\"http://www.w3.org/2000/svg\" width=\"100%\" height=\"100%\" preserveAspectRatio=\"none\">\n  <defs>\n    <pattern id=\"dots\" x=\"0\" y=\"0\" width=\"24\" height=\"24\" patternUnits=\"userSpaceOnUse\">\n      <rect width=\"24\" height=\"24\" fill=\"{bg}\"/>\n      <circle cx=\"6\" cy=\"6\" r=\"3\" fill=\"{dot}\"/>\n      <circle cx=\"18\" cy=\"18\" r=\"3\" fill=\"{dot}\"/>\n    </pattern>\n  </defs>\n  <rect width=\"400\" height=\"200\" fill=\"url(#dots)\"/>\n</svg>"""
 
 
+@functools.lru_cache(maxsize=None)
 def svg_diagonal_stripes(bg: str = "#ffffff", stripe: str = "#f1f5f9") -> str:
     return f"""<svg viewBox=\"0 0 400 200\" xmlns=\"http://www.w3.org/2000/svg\" width=\"100%\" height=\"100%\" preserveAspectRatio=\"none\">\n  <defs>\n    <pattern id=\"diagonal\" width=\"20\" height=\"20\" patternUnits=\"userSpaceOnUse\" patternTransform=\"rotate(45)\">\n      <rect width=\"20\" height=\"20\" fill=\"{bg}\"/>\n      <rect width=\"10\" height=\"20\" fill=\"{stripe}\"/>\n    </pattern>\n  </defs>\n  <rect width=\"400\" height=\"200\" fill=\"url(#diagonal)\"/>\n</svg>"""
 
 
+
+# Characters that are unsafe inside a quoted CSS ``url('data:...')``; spaces,
+# ``=``, ``/`` and the rest of the markup stay readable.
+_SVG_URL_ESCAPES = str.maketrans({
+    "%": "%25", "#": "%23", "<": "%3C", ">": "%3E", '"': "%22", "'": "%27",
+    "\\": "%5C", "\n": "%0A", "\r": "%0D", "\t": "%09",
+})
+
+
+@functools.lru_cache(maxsize=64)
+def svg_url_quote(svg: str) -> str:
+    """Encode SVG markup for use in a quoted ``data:image/svg+xml`` URL.
+
+    Only the characters a browser cannot take literally are escaped, which
+    keeps the URL close to the size of the SVG itself (full percent-encoding
+    roughly doubles it).
+    """
+    if not svg.isascii():
+        return urllib.parse.quote_from_bytes(svg.encode("utf-8"), safe="")
+    return svg.translate(_SVG_URL_ESCAPES)
+
 BACKGROUND_SCOPE_CHOICES = ["Entire site", "Current page"]
 BACKGROUND_KIND_CHOICES = ["Solid", "Gradient", "Image", "Pattern"]
 BACKGROUND_PATTERN_PRESETS: Dict[str, str] = {
@@ -1976,7 +2269,7 @@ BACKGROUND_PATTERN_PRESETS: Dict[str, str] = {
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateSpec:
     name: str
     description: str
@@ -1992,24 +2285,35 @@ class TemplateSpec:
     cover_css: Optional[str] = None
 
 
+@functools.lru_cache(maxsize=None)
+def _replacement_pattern(keys: Tuple[str, ...]) -> re.Pattern[str]:
+    # Longest first so a key that prefixes another cannot shadow it.
+    ordered = sorted(keys, key=len, reverse=True)
+    return re.compile("|".join(re.escape(key) for key in ordered))
+
+
+def replace_many(text: str, replacements: Dict[str, str]) -> str:
+    """Apply every ``old -> new`` pair in ``replacements`` in one pass."""
+
+    pattern = _replacement_pattern(tuple(replacements))
+    return pattern.sub(lambda match: replacements[match.group()], text)
+
+
 def _starter_spec() -> TemplateSpec:
-    hero = html_section_hero()
-    hero = hero.replace(
-        "Headline that inspires confidence",
-        "Welcome to {{SITE_NAME}}")
-    hero = hero.replace(
-        "Explain what you offer and the value in a friendly tone.",
-        "Share a friendly, one-sentence promise that sets the tone.",
-    )
-    hero = hero.replace("Primary call to action", "Get started")
-    hero = hero.replace("Secondary link", "Preview features")
+    hero = replace_many(html_section_hero(), {
+        "Headline that inspires confidence": "Welcome to {{SITE_NAME}}",
+        "Explain what you offer and the value in a friendly tone.":
+            "Share a friendly, one-sentence promise that sets the tone.",
+        "Primary call to action": "Get started",
+        "Secondary link": "Preview features",
+    })
     two_column = html_section_two_column()
     features = html_section_features()
-    cta = html_section_cta().replace("Ready to get started?", "Launch in minutes")
-    cta = cta.replace(
-        "Invite visitors to take the next step with a clear promise.",
-        "Publish quickly, iterate often.",
-    )
+    cta = replace_many(html_section_cta(), {
+        "Ready to get started?": "Launch in minutes",
+        "Invite visitors to take the next step with a clear promise.":
+            "Publish quickly, iterate often.",
+    })
     html = "\n\n".join([hero, two_column, features, cta])
     cover_html = """
 <div class=\"cover-root\">
@@ -2159,15 +2463,14 @@ body {
 
 
 def _portfolio_spec() -> TemplateSpec:
-    hero = LAYOUT_SNIPPETS["hero-split"].html.strip()
-    hero = hero.replace("New announcement", "Case studies")
-    hero = hero.replace("Highlight the benefit", "I'm {{SITE_NAME}}")
-    hero = hero.replace(
-        "Share how you solve the problem, not the feature list.",
-        "I help teams design thoughtful, accessible web experiences.",
-    )
-    hero = hero.replace("Get started", "See projects")
-    hero = hero.replace("Talk to us", "Book a call")
+    hero = replace_many(LAYOUT_SNIPPETS["hero-split"].html.strip(), {
+        "New announcement": "Case studies",
+        "Highlight the benefit": "I'm {{SITE_NAME}}",
+        "Share how you solve the problem, not the feature list.":
+            "I help teams design thoughtful, accessible web experiences.",
+        "Get started": "See projects",
+        "Talk to us": "Book a call",
+    })
     projects = """<section class="section">
   <h2>Featured work</h2>
   <div class="grid split-2">
@@ -2184,11 +2487,11 @@ def _portfolio_spec() -> TemplateSpec:
   </div>
 </section>"""
     testimonials = html_section_testimonials()
-    cta = html_section_cta().replace("Ready to get started?", "Let’s collaborate")
-    cta = cta.replace(
-        "Invite visitors to take the next step with a clear promise.",
-        "Share a project brief and we'll schedule a kickoff call.",
-    )
+    cta = replace_many(html_section_cta(), {
+        "Ready to get started?": "Let’s collaborate",
+        "Invite visitors to take the next step with a clear promise.":
+            "Share a project brief and we'll schedule a kickoff call.",
+    })
     index_html = "\n\n".join([hero, projects, testimonials, cta])
     projects_page = """<section class="section">
   <h1>Projects</h1>
@@ -2367,16 +2670,13 @@ body {
 
 
 def _resource_spec() -> TemplateSpec:
-    hero = html_section_hero()
-    hero = hero.replace(
-        "Headline that inspires confidence",
-        "{{SITE_NAME}} Resource Hub")
-    hero = hero.replace(
-        "Explain what you offer and the value in a friendly tone.",
-        "Find guides, tutorials, and quick wins for your team.",
-    )
-    hero = hero.replace("Primary call to action", "Browse guides")
-    hero = hero.replace("Secondary link", "Contact support")
+    hero = replace_many(html_section_hero(), {
+        "Headline that inspires confidence": "{{SITE_NAME}} Resource Hub",
+        "Explain what you offer and the value in a friendly tone.":
+            "Find guides, tutorials, and quick wins for your team.",
+        "Primary call to action": "Browse guides",
+        "Secondary link": "Contact support",
+    })
     cards = """<section class="section">
   <h2>Popular guides</h2>
   <div class="grid split-3">
@@ -3697,29 +3997,23 @@ body {
 
 
 def _pricing_hero() -> str:
-    hero = html_section_hero()
-    hero = hero.replace(
-        "Headline that inspires confidence",
-        "Pricing that scales with you")
-    hero = hero.replace(
-        "Explain what you offer and the value in a friendly tone.",
-        "Pick the plan that matches your stage.")
-    hero = hero.replace("Primary call to action", "Choose a plan")
-    hero = hero.replace("Secondary link", "Contact sales")
-    return hero
+    return replace_many(html_section_hero(), {
+        "Headline that inspires confidence": "Pricing that scales with you",
+        "Explain what you offer and the value in a friendly tone.":
+            "Pick the plan that matches your stage.",
+        "Primary call to action": "Choose a plan",
+        "Secondary link": "Contact sales",
+    })
 
 
 def _contact_intro() -> str:
-    hero = html_section_hero()
-    hero = hero.replace(
-        "Headline that inspires confidence",
-        "We’d love to hear from you")
-    hero = hero.replace(
-        "Explain what you offer and the value in a friendly tone.",
-        "Reach out with project ideas, support questions, or quick hellos.")
-    hero = hero.replace("Primary call to action", "Send a message")
-    hero = hero.replace("Secondary link", "Schedule a call")
-    return hero
+    return replace_many(html_section_hero(), {
+        "Headline that inspires confidence": "We’d love to hear from you",
+        "Explain what you offer and the value in a friendly tone.":
+            "Reach out with project ideas, support questions, or quick hellos.",
+        "Primary call to action": "Send a message",
+        "Secondary link": "Schedule a call",
+    })
 
 
 def _docs_outline() -> str:
@@ -3861,7 +4155,7 @@ PROJECT_TEMPLATES: Dict[str, TemplateSpec] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateDefinition:
     key: str
     title: str
@@ -3930,13 +4224,17 @@ def _contrast_text_for(color: QtGui.QColor) -> QtGui.QColor:
         "#0f172a") if luminance > 0.55 else QtGui.QColor("#f8fafc")
 
 
+_PARAGRAPH_RE = re.compile(r"<p[^>]*>(.*?)</p>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
 def _extract_tagline(project: Project) -> str:
     if not project.pages:
         return "Design, launch, and iterate with confidence."
     html = project.pages[0].html
-    match = re.search(r"<p[^>]*>(.*?)</p>", html, re.IGNORECASE | re.DOTALL)
+    match = _PARAGRAPH_RE.search(html)
     if match:
-        text = re.sub(r"<[^>]+>", "", match.group(1)).strip()
+        text = _TAG_RE.sub("", match.group(1)).strip()
         if text:
             return text[:220]
     spec = PROJECT_TEMPLATES.get(project.template_key)
@@ -4426,21 +4724,27 @@ BASE_TEMPLATE = """\
 """
 
 
-def build_base_css(
-    palette: Dict[str, str],
-    fonts: Dict[str, str],
-    radius_scale: float = 1.0,
-    shadow_level: str = "md",
-) -> str:
-    primary = palette.get("primary", DEFAULT_PALETTE["primary"])
-    surface = palette.get("surface", DEFAULT_PALETTE["surface"])
-    text = palette.get("text", DEFAULT_PALETTE["text"])
-    heading_font = fonts.get("heading", DEFAULT_FONTS["heading"])
-    body_font = fonts.get("body", DEFAULT_FONTS["body"])
-    radius_scale_str = f"{radius_scale:g}" if radius_scale else "1"
-    level = shadow_level if shadow_level in {
-        "none", "sm", "md", "lg"} else "md"
-    return f""":root {{
+_MIN_CSS_RE = re.compile(r"/\*.*?\*/|\s*([{};:,>+~])\s*|\s+", re.S)
+_STYLE_BLOCK_RE = re.compile(r"(<style>)(.*?)(</style>)", re.S)
+
+
+def _minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace around CSS punctuation."""
+    return _MIN_CSS_RE.sub(
+        lambda m: "" if m.group(0).startswith("/*") else (m.group(1) or " "),
+        css).strip()
+
+
+def _minify_style_blocks(markup: str) -> str:
+    return _STYLE_BLOCK_RE.sub(
+        lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), markup)
+
+
+# The inline <style> is repeated in every page, so it ships minified.
+BASE_TEMPLATE_MIN = _minify_style_blocks(BASE_TEMPLATE)
+
+
+_BASE_CSS_TEMPLATE = """:root {{
   --color-primary: {primary};
   --color-surface: {surface};
   --color-text: {text};
@@ -4500,6 +4804,44 @@ a {{
 """
 
 
+def build_base_css(
+    palette: Dict[str, str],
+    fonts: Dict[str, str],
+    radius_scale: float = 1.0,
+    shadow_level: str = "md",
+) -> str:
+    return _build_base_css_cached(
+        palette.get("primary", DEFAULT_PALETTE["primary"]),
+        palette.get("surface", DEFAULT_PALETTE["surface"]),
+        palette.get("text", DEFAULT_PALETTE["text"]),
+        fonts.get("heading", DEFAULT_FONTS["heading"]),
+        fonts.get("body", DEFAULT_FONTS["body"]),
+        radius_scale,
+        shadow_level,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _build_base_css_cached(
+    primary: str,
+    surface: str,
+    text: str,
+    heading_font: str,
+    body_font: str,
+    radius_scale: float,
+    shadow_level: str,
+) -> str:
+    return _BASE_CSS_TEMPLATE.format_map({
+        "primary": primary,
+        "surface": surface,
+        "text": text,
+        "heading_font": heading_font,
+        "body_font": body_font,
+        "radius_scale_str": f"{radius_scale:g}" if radius_scale else "1",
+        "level": shadow_level if shadow_level in {"none", "sm", "md", "lg"} else "md",
+    })
+
+
 def generate_base_css(
     palette: Dict[str, str],
     fonts: Dict[str, str],
@@ -4511,11 +4853,52 @@ def generate_base_css(
     return build_base_css(palette, fonts, radius_scale, shadow_level)
 
 
-def _jinja_env() -> Environment:
-    return Environment(
-        loader=DictLoader({"base.html.j2": BASE_TEMPLATE}),
+RENDER_WORKERS = min(8, os.cpu_count() or 4)
+
+
+def _run_parallel(func: Callable[..., None], items: List) -> None:
+    """Apply ``func`` to every item on a small thread pool.
+
+    Exceptions raised by a worker propagate to the caller. Single items run
+    inline so one-page previews do not pay for pool start-up.
+    """
+
+    if len(items) <= 1:
+        for item in items:
+            func(item)
+        return
+    with ThreadPoolExecutor(max_workers=min(RENDER_WORKERS, len(items))) as pool:
+        list(pool.map(func, items))
+
+
+# The bundled scripts are written on every export; encode and hash them once.
+_MAIN_JS_BYTES = MAIN_JS_SNIPPET.encode("utf-8")
+_MAIN_JS_DIGEST = content_digest(_MAIN_JS_BYTES)
+_SCROLL_JS_BYTES = SCROLL_JS_SNIPPET.encode("utf-8")
+_SCROLL_JS_DIGEST = content_digest(_SCROLL_JS_BYTES)
+
+
+@functools.lru_cache(maxsize=1)
+def _base_template() -> Template:
+    """Return the compiled page template, built once per process.
+
+    The compiled bytecode is kept in ``TEMPLATE_CACHE_DIR`` so later launches
+    skip parsing the template; Jinja recompiles when the source changes.
+    """
+
+    try:
+        TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR))
+    except OSError:
+        bytecode_cache = None
+    env = Environment(
+        loader=DictLoader({"base.html.j2": BASE_TEMPLATE_MIN}),
         autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=bytecode_cache,
     )
+    return env.get_template("base.html.j2")
 
 
 @dataclass
@@ -4528,7 +4911,7 @@ def migrate_project_v1_to_v2(data: Dict[str, object]) -> Dict[str, object]:
     pages_data = data.get("pages", [])
     if not isinstance(pages_data, list):
         pages_data = []
-    pages = [Page(**p) for p in pages_data]
+    pages = [Page.from_dict(p) for p in pages_data if isinstance(p, dict)]
     project = Project(
         name=str(data.get("name", "My Site")),
         pages=pages,
@@ -4542,8 +4925,33 @@ def migrate_project_v1_to_v2(data: Dict[str, object]) -> Dict[str, object]:
     return project.to_dict()
 
 
+# Binary .siteproj files start with this tag followed by a msgpack payload
+# that carries image data as raw bytes ("data") rather than base64 text;
+# anything else is read as JSON. Projects are always saved as JSON, and
+# binary files can only be opened where msgpack is installed.
+PROJECT_MAGIC = b"WBN2"
+
+
+def _unpack_image_data(payload: Dict[str, Any]) -> None:
+    for image in payload.get("images", ()):
+        if isinstance(image, dict) and isinstance(image.get("data"), bytes):
+            image["data_base64"] = base64.b64encode(
+                image.pop("data")).decode("ascii")
+
+
+def _decode_project_bytes(data: bytes) -> Dict[str, object]:
+    if data.startswith(PROJECT_MAGIC):
+        if msgpack is None:
+            raise ValueError(
+                "This project was saved in the binary format; install msgpack to open it.")
+        payload = msgpack.unpackb(data[len(PROJECT_MAGIC):], raw=False)
+        _unpack_image_data(payload)
+        return payload
+    return json_loads(data)
+
+
 def load_project(path: Path) -> MigrationResult:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = _decode_project_bytes(path.read_bytes())
     migrated = False
     version = int(raw.get("version", 1))
     if version == 1:
@@ -4554,17 +4962,54 @@ def load_project(path: Path) -> MigrationResult:
     return MigrationResult(project=project, migrated=migrated)
 
 
-def save_project(path: Path, project: Project) -> None:
-    payload = project.to_dict()
-    path.write_text(
-        json.dumps(
-            payload,
-            indent=2,
-            ensure_ascii=False),
-        encoding="utf-8")
+SAVE_BUFFER_SIZE = 1 << 17
 
 
-def render_site(project: Project, output_dir: Path) -> None:
+def _write_project(fh: BinaryIO, payload: Dict[str, Any],
+                   pretty: bool = True) -> None:
+    if orjson is not None:
+        fh.write(json_dumps_bytes(payload, indent=pretty))
+        return
+    # json.dump streams encoder chunks, so the document is never held
+    # as one str alongside its encoded bytes.
+    text = io.TextIOWrapper(fh, encoding="utf-8")
+    if pretty:
+        json.dump(payload, text, indent=2, ensure_ascii=False)
+    else:
+        json.dump(payload, text, separators=(",", ":"), ensure_ascii=False)
+    text.detach()
+
+
+def save_project(path: Path, project: Project, pretty: bool = True) -> None:
+    """Write ``project`` to ``path``.
+
+    JSON output is indented for people reading the file; background saves
+    the user did not ask for pass ``pretty=False`` for the compact form.
+    """
+    payload = project.to_dict()
+    # Never leave a truncated project behind if the write fails midway.
+    atomic_write(path, lambda fh: _write_project(fh, payload, pretty),
+                 buffering=SAVE_BUFFER_SIZE)
+
+
+def render_site(
+    project: Project,
+    output_dir: Path,
+    *,
+    pages: Optional[List[Page]] = None,
+    write_assets: bool = True,
+    write_pages: bool = True,
+    write_css: bool = True,
+) -> Dict[str, str]:
+    """Render ``project`` into ``output_dir``.
+
+    ``pages`` limits which pages are rendered; BASE_TEMPLATE has no site
+    nav, so the other pages are not needed. With ``write_assets`` off,
+    images, vendored files and scripts are assumed to be in place already,
+    and with ``write_css`` off so is the stylesheet. With ``write_pages``
+    off the page HTML is only returned, leaving the caller to write it.
+    Returns the rendered HTML keyed by filename.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     assets_dir = output_dir / "assets"
     css_dir = assets_dir / "css"
@@ -4573,33 +5018,28 @@ def render_site(project: Project, output_dir: Path) -> None:
     vendor_dir = assets_dir / "vendor"
     css_dir.mkdir(parents=True, exist_ok=True)
     img_dir.mkdir(parents=True, exist_ok=True)
-    if vendor_dir.exists():
+    if write_assets and vendor_dir.exists():
         shutil.rmtree(vendor_dir)
     external_css_payload: List[Dict[str, str]] = []
     external_js_payload: List[Dict[str, str]] = []
-    css_source = project.css or ""
-    css = ensure_block(css_source, CSS_HELPERS_SENTINEL, CSS_HELPERS_BLOCK)
-    css = ensure_block(css, BG_HELPERS_SENTINEL, BG_HELPERS_BLOCK)
-    css = ensure_block(
-        css,
-        GRADIENT_HELPERS_SENTINEL,
-        gradient_helpers_block(
-            project.gradients))
-    css = ensure_block(
-        css,
-        ANIM_HELPERS_SENTINEL,
-        animation_helpers_block(
-            project.motion_pref))
-    extra_block = extract_css_block(css_source, TEMPLATE_EXTRA_SENTINEL)
-    if extra_block:
-        css = ensure_block(
-            css,
-            TEMPLATE_EXTRA_SENTINEL,
-            f"{TEMPLATE_EXTRA_SENTINEL}\n{extra_block}")
-    (css_dir / "style.css").write_text(css, encoding="utf-8")
-    for asset in project.images:
-        data = base64.b64decode(asset.data_base64.encode("ascii"))
-        (img_dir / asset.name).write_bytes(data)
+    if write_css:
+        css = project.css or ""
+        # The template extra block only ever comes from the project CSS
+        # itself, so it is already in place; only the helper blocks may need
+        # appending.
+        css = ensure_blocks(css, (
+            (CSS_HELPERS_SENTINEL, CSS_HELPERS_BLOCK),
+            (BG_HELPERS_SENTINEL, BG_HELPERS_BLOCK),
+            (GRADIENT_HELPERS_SENTINEL, gradient_helpers_block(project.gradients)),
+            (ANIM_HELPERS_SENTINEL, animation_helpers_block(project.motion_pref)),
+        ), present=_shared_css_blocks(css))
+        write_if_changed(css_dir / "style.css", css.encode("utf-8"))
+
+    def _write_image(asset: AssetImage) -> None:
+        write_base64_asset(img_dir / asset.name, asset.data_base64)
+
+    if write_assets:
+        _run_parallel(_write_image, project.images)
     for asset in project.external:
         href_value = asset.href
         rel_path: Optional[Path] = None
@@ -4629,59 +5069,117 @@ def render_site(project: Project, output_dir: Path) -> None:
             if asset.sri:
                 payload["sri"] = asset.sri
             external_js_payload.append(payload)
-        if asset.mode == "local" and asset.data_base64 and rel_path is not None:
+        if write_assets and asset.mode == "local" and asset.data_base64 and rel_path is not None:
             target = output_dir / rel_path
             target.parent.mkdir(parents=True, exist_ok=True)
             try:
-                blob = base64.b64decode(asset.data_base64.encode("ascii"))
+                write_base64_asset(target, asset.data_base64)
             except Exception:
-                blob = b""
-            if blob:
-                target.write_bytes(blob)
+                pass
     js_needed = project.use_main_js or project.use_scroll_animations
-    if js_needed:
+    if write_assets and js_needed:
         js_dir.mkdir(parents=True, exist_ok=True)
         main_js_path = js_dir / "main.js"
         site_js_path = js_dir / "site.js"
         if project.use_main_js:
-            main_js_path.write_text(MAIN_JS_SNIPPET, encoding="utf-8")
+            write_if_changed(main_js_path, _MAIN_JS_BYTES, _MAIN_JS_DIGEST)
         elif main_js_path.exists():
             main_js_path.unlink()
         if project.use_scroll_animations:
-            site_js_path.write_text(SCROLL_JS_SNIPPET, encoding="utf-8")
+            write_if_changed(site_js_path, _SCROLL_JS_BYTES, _SCROLL_JS_DIGEST)
         elif site_js_path.exists():
             site_js_path.unlink()
-    elif js_dir.exists():
+    elif write_assets and js_dir.exists():
         shutil.rmtree(js_dir)
-    env = _jinja_env()
-    template = env.get_template("base.html.j2")
-    nav = [{"filename": p.filename, "title": p.title} for p in project.pages]
-    for page in project.pages:
-        html = template.render(
-            site_name=project.name,
-            title=page.title,
-            pages=nav,
-            content=page.html,
-            include_js=project.use_main_js,
-            use_scroll_js=project.use_scroll_animations,
-            page_slug=slugify(Path(page.filename).stem),
-            external_css=external_css_payload,
-            external_js=external_js_payload,
-            color_primary=project.palette.get(
-                "primary", DEFAULT_PALETTE["primary"]),
-            color_surface=project.palette.get(
-                "surface", DEFAULT_PALETTE["surface"]),
-            color_text=project.palette.get("text", DEFAULT_PALETTE["text"]),
-            heading_font=project.fonts.get(
-                "heading", DEFAULT_FONTS["heading"]),
-            body_font=project.fonts.get("body", DEFAULT_FONTS["body"]),
-        )
-        (output_dir / page.filename).write_text(html, encoding="utf-8")
+    template = _base_template()
+    common: Dict[str, object] = {
+        "site_name": project.name,
+        "include_js": project.use_main_js,
+        "use_scroll_js": project.use_scroll_animations,
+        "external_css": external_css_payload,
+        "external_js": external_js_payload,
+        "color_primary": project.palette.get(
+            "primary", DEFAULT_PALETTE["primary"]),
+        "color_surface": project.palette.get(
+            "surface", DEFAULT_PALETTE["surface"]),
+        "color_text": project.palette.get("text", DEFAULT_PALETTE["text"]),
+        "heading_font": project.fonts.get(
+            "heading", DEFAULT_FONTS["heading"]),
+        "body_font": project.fonts.get("body", DEFAULT_FONTS["body"]),
+    }
+
+    rendered: Dict[str, str] = {}
+
+    def _render_page(row: Tuple[str, str, str]) -> None:
+        filename, title, body = row
+        html = render_template(template, {
+            **common,
+            "title": title,
+            "content": body,
+            "page_slug": slugify(os.path.splitext(filename)[0]),
+        })
+        if write_pages:
+            write_if_changed(output_dir / filename, html.encode("utf-8"))
+        rendered[filename] = html
+
+    # Snapshot the wanted pages as plain tuples: the workers never read the
+    # live Page objects the UI may be editing. BASE_TEMPLATE has no nav of
+    # its own (page bodies carry theirs), so other pages are not touched.
+    wanted = None if pages is None else {page.filename for page in pages}
+    rows = [(p.filename, p.title, p.html) for p in project.pages
+            if wanted is None or p.filename in wanted]
+    _run_parallel(_render_page, rows)
+    return rendered
+
+
+def render_single_page(project: Project, page: Page, output_dir: Path,
+                       *, write_page: bool = True,
+                       write_css: bool = True) -> str:
+    """Re-render one page and the stylesheet into an existing render of ``project``."""
+    return render_site(
+        project, output_dir, pages=[page], write_assets=False,
+        write_pages=write_page, write_css=write_css).get(page.filename, "")
+
+
+_BODY_CLASS_RE = re.compile(r'<body class="([^"]*)">')
+
+
+def _split_page_document(document: str, content: str) -> Optional[Tuple[str, str]]:
+    """Split a page rendered from ``BASE_TEMPLATE`` around its ``content``.
+
+    Returns ``(head, tail)``: everything up to and including the opening
+    ``<body>`` tag, and everything after the content. ``None`` when the
+    document does not have the template's shape.
+    """
+    match = _BODY_CLASS_RE.search(document)
+    if match is None:
+        return None
+    start = match.end()
+    if not document.startswith("\n  " + content, start):
+        return None
+    return document[:start], document[start + 3 + len(content):]
 
 
 def render_project(project: Project, output_dir: Path) -> None:
     render_site(project, output_dir)
 
+
+def export_project_zip(project: Project, out_zip: Path) -> None:
+    # Imported here: only ZIP export needs it and it is not free at startup.
+    import zipfile
+
+    tmp_dir = tempfile.mkdtemp(prefix="webineer_publish_")
+    try:
+        render_project(project, Path(tmp_dir))
+        with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for root, _, files in os.walk(tmp_dir):
+                for filename in files:
+                    file_path = os.path.join(root, filename)
+                    arcname = os.path.relpath(file_path, tmp_dir)
+                    zf.write(file_path, arcname)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
 # ---------------------------------------------------------------------------
 # Recent projects manager and thumbnails
 # ---------------------------------------------------------------------------
@@ -4730,20 +5228,14 @@ class RecentProjectsManager:
         self.load()
 
     def load(self) -> None:
-        if not RECENTS_PATH.exists():
-            self._items = []
-            return
         try:
-            data = json.loads(RECENTS_PATH.read_text(encoding="utf-8"))
+            data = read_json_file(RECENTS_PATH)
             self._items = [RecentItem.from_dict(item) for item in data]
         except Exception:
             self._items = []
 
     def save(self) -> None:
-        RECENTS_PATH.write_text(
-            json.dumps([item.to_dict() for item in self._items], indent=2),
-            encoding="utf-8",
-        )
+        write_json_file(RECENTS_PATH, [item.to_dict() for item in self._items])
 
     def add_or_bump(self, path: Path, project: Project) -> None:
         path_str = str(path)
@@ -4880,7 +5372,7 @@ class TemplatePreviewDialog(QtWidgets.QDialog):
         self.setWindowTitle(f"{title} preview")
         self.resize(960, 640)
         layout = QtWidgets.QVBoxLayout(self)
-        self.view = QWebEngineView(self)
+        self.view = new_web_view(self)
         layout.addWidget(self.view, 1)
         buttons = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Close, parent=self)
@@ -4995,7 +5487,7 @@ class TemplateSelectDialog(QtWidgets.QDialog):
         preview_layout = QtWidgets.QVBoxLayout(preview_container)
         preview_layout.setContentsMargins(0, 0, 0, 0)
         preview_layout.addWidget(QtWidgets.QLabel("Live preview"))
-        self.preview_view = QWebEngineView(preview_container)
+        self.preview_view = new_web_view(preview_container)
         preview_layout.addWidget(self.preview_view, 1)
         splitter.addWidget(preview_container)
         splitter.setSizes([380, 700])
@@ -5192,7 +5684,7 @@ class PageTemplateDialog(QtWidgets.QDialog):
 
     def result(self) -> Tuple[str, str, str]:
         title = self.title_edit.text().strip() or "Page"
-        slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "page"
+        slug = _SLUG_SEPARATOR_RE.sub("-", title.lower()).strip("-") or "page"
         filename = "index.html" if slug == "index" else f"{slug}.html"
         html = self.build_html()
         return title, filename, html
@@ -5343,6 +5835,77 @@ class AssetListWidget(QtWidgets.QListWidget):
         else:
             super().dropEvent(event)
 
+
+class PageListView(QtWidgets.QListView):
+    """Page list backed by a string model that is replaced in a single reset.
+
+    Mirrors the small part of the ``QListWidget`` API the main window uses.
+    """
+
+    currentRowChanged = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self._model = QtCore.QStringListModel(self)
+        self.setModel(self._model)
+        self.setUniformItemSizes(True)
+        self.setEditTriggers(
+            QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        selection = self.selectionModel()
+        if selection is not None:
+            selection.currentRowChanged.connect(self._on_current_row_changed)
+
+    def _on_current_row_changed(
+            self, current: QtCore.QModelIndex, _previous: QtCore.QModelIndex) -> None:
+        self.currentRowChanged.emit(current.row() if current.isValid() else -1)
+
+    def set_labels(self, labels: List[str]) -> None:
+        """Apply ``labels`` by touching only the rows that differ.
+
+        The current row is cleared afterwards, as a full reset would, so the
+        caller's next ``setCurrentRow`` always emits ``currentRowChanged``.
+        """
+        model = self._model
+        current = model.stringList()
+        if current != labels:
+            self.setUpdatesEnabled(False)
+            try:
+                self._apply_label_diff(current, labels)
+            finally:
+                self.setUpdatesEnabled(True)
+        selection = self.selectionModel()
+        if selection is not None:
+            selection.clear()
+
+    def _apply_label_diff(self, current: List[str], labels: List[str]) -> None:
+        model = self._model
+        limit = min(len(current), len(labels))
+        head = 0
+        while head < limit and current[head] == labels[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and current[-1 - tail] == labels[-1 - tail]:
+            tail += 1
+        old_span = len(current) - head - tail
+        new_span = len(labels) - head - tail
+        if old_span > new_span:
+            model.removeRows(head + new_span, old_span - new_span)
+        elif new_span > old_span:
+            model.insertRows(head + old_span, new_span - old_span)
+        for row in range(head, head + new_span):
+            if row - head >= old_span or current[row] != labels[row]:
+                model.setData(model.index(row, 0), labels[row])
+
+    def count(self) -> int:
+        return self._model.rowCount()
+
+    def currentRow(self) -> int:
+        index = self.currentIndex()
+        return index.row() if index.isValid() else -1
+
+    def setCurrentRow(self, row: int) -> None:
+        self.setCurrentIndex(self._model.index(row, 0))
+
 # ---------------------------------------------------------------------------
 # Guided plan dialog
 # ---------------------------------------------------------------------------
@@ -5569,7 +6132,7 @@ class NewProjectWizard(QtWidgets.QDialog):
         preview_layout.setContentsMargins(0, 0, 0, 0)
         preview_layout.setSpacing(12)
         preview_layout.addWidget(QtWidgets.QLabel("Live preview"))
-        self.template_preview = QWebEngineView(preview_container)
+        self.template_preview = new_web_view(preview_container)
         preview_layout.addWidget(self.template_preview, 1)
         self.template_caption = QtWidgets.QLabel(
             "Select a template to see its hero styling and sections with your theme."
@@ -5808,17 +6371,16 @@ class NewProjectWizard(QtWidgets.QDialog):
         )
         project.theme_preset = theme
         project.output_dir = location
-        path = Path(location) / f"{
-            re.sub(
-                r'[^a-zA-Z0-9_-]+',
-                '-',
-                name.lower()).strip('-') or 'site'}.siteproj"
+        path = Path(location) / f"{project_file_slug(name)}.siteproj"
         return project, path
 
     def project_result(self) -> Tuple[Optional[Project], Optional[Path]]:
         return self._project_result, self._path_result
 
 
+_LEAD_PARAGRAPH_RE = re.compile(r"<p class=\"lead\">.*?</p>")
+
+
 def create_project_from_template(
     name: str,
     template_key: str,
@@ -5844,19 +6406,15 @@ def create_project_from_template(
         title = page_titles.get(default_title, default_title)
         content = html.replace("{{SITE_NAME}}", name)
         if blurb and default_title.lower() == "home":
-            content = re.sub(
-                r"<p class=\"lead\">.*?</p>",
-                f"<p class=\"lead\">{blurb}</p>",
-                content,
-                count=1,
-            )
+            content = _LEAD_PARAGRAPH_RE.sub(
+                f"<p class=\"lead\">{blurb}</p>", content, count=1)
         pages.append(Page(filename=filename, title=title, html=content))
         existing_filenames.add(filename)
 
     for title in selected_pages:
         if title in spec_titles:
             continue
-        slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "page"
+        slug = _SLUG_SEPARATOR_RE.sub("-", title.lower()).strip("-") or "page"
         filename = f"{slug}.html"
         counter = 1
         while filename in existing_filenames:
@@ -5908,28 +6466,35 @@ def create_project_from_template(
     return project
 
 
+@functools.lru_cache(maxsize=None)
+def _placeholder_png(width: int, height: int) -> Tuple[str, int, int]:
+    """Return base64 PNG data and pixel size for a placeholder image."""
+    pix = QtGui.QPixmap(width // 6, height // 6)
+    pix.fill(QtGui.QColor("#e2e8f0"))
+    painter = QtGui.QPainter(pix)
+    painter.setPen(QtGui.QPen(QtGui.QColor("#94a3b8"), 4))
+    painter.drawRect(6, 6, pix.width() - 12, pix.height() - 12)
+    painter.end()
+    buffer = QtCore.QBuffer()
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    pix.save(buffer, "PNG")
+    data = base64.b64encode(buffer.data().data()).decode("ascii")
+    return data, pix.width(), pix.height()
+
+
 def placeholder_images() -> List[AssetImage]:
     images: List[AssetImage] = []
     for name, width, height in [
         ("placeholder-wide.png", 1200, 720),
         ("placeholder-portrait.png", 600, 800),
     ]:
-        pix = QtGui.QPixmap(width // 6, height // 6)
-        pix.fill(QtGui.QColor("#e2e8f0"))
-        painter = QtGui.QPainter(pix)
-        painter.setPen(QtGui.QPen(QtGui.QColor("#94a3b8"), 4))
-        painter.drawRect(6, 6, pix.width() - 12, pix.height() - 12)
-        painter.end()
-        buffer = QtCore.QBuffer()
-        buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
-        pix.save(buffer, "PNG")
-        data = base64.b64encode(buffer.data().data()).decode("ascii")
+        data, pix_width, pix_height = _placeholder_png(width, height)
         images.append(
             AssetImage(
                 name=name,
                 data_base64=data,
-                width=pix.width(),
-                height=pix.height(),
+                width=pix_width,
+                height=pix_height,
                 mime="image/png")
         )
     return images
@@ -5937,9 +6502,18 @@ def placeholder_images() -> List[AssetImage]:
 
 def generate_svg_placeholder(
         width: int, height: int, palette: Dict[str, str]) -> str:
-    primary = palette.get("primary", DEFAULT_PALETTE["primary"])
-    surface = palette.get("surface", DEFAULT_PALETTE["surface"])
-    text = palette.get("text", DEFAULT_PALETTE["text"])
+    return _svg_placeholder(
+        width,
+        height,
+        palette.get("primary", DEFAULT_PALETTE["primary"]),
+        palette.get("surface", DEFAULT_PALETTE["surface"]),
+        palette.get("text", DEFAULT_PALETTE["text"]),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _svg_placeholder(width: int, height: int, primary: str,
+                     surface: str, text: str) -> str:
     return (
         f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' viewBox='0 0 {width} {height}'>"
         f"<defs><linearGradient id='g' x1='0' y1='0' x2='1' y2='1'>"
@@ -6612,11 +7186,7 @@ class StartWindow(QtWidgets.QMainWindow):
         project.output_dir = location
         save_dir = Path(location)
         save_dir.mkdir(parents=True, exist_ok=True)
-        slug = re.sub(
-            r"[^a-zA-Z0-9_-]+",
-            "-",
-            name.lower()).strip("-") or "site"
-        project_path = save_dir / f"{slug}.siteproj"
+        project_path = save_dir / f"{project_file_slug(name)}.siteproj"
         if project_path.exists():
             if QtWidgets.QMessageBox.question(
                 self, "Overwrite?", f"{
@@ -6685,7 +7255,7 @@ class StartWindow(QtWidgets.QMainWindow):
             self.import_summary.setPlainText(
                 "Upgraded to Webineer v2. You're all set!")
             try:
-                save_project(project_path, result.project)
+                save_project(project_path, result.project, pretty=False)
             except Exception:
                 pass
         else:
@@ -6709,7 +7279,7 @@ class StartWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(
                 self, "Upgraded", "We upgraded this project to the latest format.")
             try:
-                save_project(path, result.project)
+                save_project(path, result.project, pretty=False)
             except Exception:
                 pass
         self.project_opened.emit(result.project, path)
@@ -6719,24 +7289,40 @@ class StartWindow(QtWidgets.QMainWindow):
         self.recents.load()
         items = self.recents.list()
         if hasattr(self, "recent_tiles"):
-            self.recent_tiles.clear()
-            for entry in items:
-                display = f"📌 {entry.name}" if entry.pinned else entry.name
-                tile = QtWidgets.QListWidgetItem(display)
-                tile.setData(Qt.ItemDataRole.UserRole, entry.path)
-                tooltip = f"{entry.path}\nLast opened: {entry.last_opened}"
-                tile.setToolTip(tooltip)
-                icon_path = entry.cover or entry.thumbnail
-                if icon_path and Path(icon_path).exists():
-                    tile.setIcon(QtGui.QIcon(icon_path))
-                else:
-                    fallback = self._template_preview_pixmap(
-                        self._selected_template)
-                    tile.setIcon(QtGui.QIcon(fallback))
-                tile.setData(Qt.ItemDataRole.AccessibleTextRole, display)
-                self.recent_tiles.addItem(tile)
+            self.recent_tiles.setUpdatesEnabled(False)
+            try:
+                self._fill_recent_tiles(items)
+            finally:
+                self.recent_tiles.setUpdatesEnabled(True)
         if not hasattr(self, "recent_list"):
             return
+        self.recent_list.setUpdatesEnabled(False)
+        try:
+            self._fill_recent_list(items)
+        finally:
+            self.recent_list.setUpdatesEnabled(True)
+
+    def _fill_recent_tiles(self, items: List[RecentItem]) -> None:
+        self.recent_tiles.clear()
+        fallback_icon: Optional[QtGui.QIcon] = None
+        for entry in items:
+            display = f"📌 {entry.name}" if entry.pinned else entry.name
+            tile = QtWidgets.QListWidgetItem(display)
+            tile.setData(Qt.ItemDataRole.UserRole, entry.path)
+            tooltip = f"{entry.path}\nLast opened: {entry.last_opened}"
+            tile.setToolTip(tooltip)
+            icon_path = entry.cover or entry.thumbnail
+            if icon_path and Path(icon_path).exists():
+                tile.setIcon(QtGui.QIcon(icon_path))
+            else:
+                if fallback_icon is None:
+                    fallback_icon = QtGui.QIcon(self._template_preview_pixmap(
+                        self._selected_template))
+                tile.setIcon(fallback_icon)
+            tile.setData(Qt.ItemDataRole.AccessibleTextRole, display)
+            self.recent_tiles.addItem(tile)
+
+    def _fill_recent_list(self, items: List[RecentItem]) -> None:
         self.recent_list.clear()
         for item in items:
             list_item = QtWidgets.QListWidgetItem(item.name)
@@ -6789,12 +7375,89 @@ class StartWindow(QtWidgets.QMainWindow):
         self.refresh_recents()
         self.status_bar.showMessage("Cleaned up missing entries", 3000)
 
+# ---------------------------------------------------------------------------
+# Background preview rendering
+# ---------------------------------------------------------------------------
+
+
+class _PreviewSignals(QObject):
+    finished = pyqtSignal(int, object)
+    errored = pyqtSignal(int, str)
+
+
+class _PreviewRenderJob(QtCore.QRunnable):
+    """Render a project snapshot into the preview directory off the GUI thread.
+
+    Results are reported with the job's sequence number so the window can
+    drop renders that were overtaken by newer edits.
+    """
+
+    def __init__(self, seq: int, project: Project, output_dir: Path,
+                 page: Optional[Page], signals: _PreviewSignals,
+                 write_css: bool = True) -> None:
+        super().__init__()
+        self.seq = seq
+        self.project = project
+        self.output_dir = output_dir
+        self.page = page
+        self.signals = signals
+        self.write_css = write_css
+
+    def run(self) -> None:
+        try:
+            if self.page is None:
+                rendered = render_site(self.project, self.output_dir)
+                self.signals.finished.emit(self.seq, rendered)
+                return
+            html = render_single_page(
+                self.project, self.page, self.output_dir, write_page=False,
+                write_css=self.write_css)
+            target = self.output_dir / self.page.filename
+            if not fits_set_html(html):
+                # Too large for setHtml: the view loads the file, so it
+                # has to be on disk first.
+                write_if_changed(target, html.encode("utf-8"))
+                self.signals.finished.emit(
+                    self.seq, {self.page.filename: html})
+                return
+            # The view gets the markup directly; the file is only needed
+            # for nav links and later page switches, so write it afterwards.
+            self.signals.finished.emit(self.seq, {self.page.filename: html})
+            write_if_changed(target, html.encode("utf-8"))
+        except Exception as exc:
+            self.signals.errored.emit(self.seq, str(exc))
+
+
+class _IOJobSignals(QObject):
+    finished = pyqtSignal(bool, str)
+
+
+class _IOJob(QtCore.QRunnable):
+    """Run a save or export callable off the GUI thread.
+
+    ``finished`` carries ``(ok, error message)`` back to the window.
+    """
+
+    def __init__(self, task: Callable[[], object], signals: _IOJobSignals) -> None:
+        super().__init__()
+        self.task = task
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            self.task()
+        except Exception as exc:
+            self.signals.finished.emit(False, str(exc))
+            return
+        self.signals.finished.emit(True, "")
+
+
 # ---------------------------------------------------------------------------
 # Main builder window
 # ---------------------------------------------------------------------------
 
 
-class MainWindow(QtWidgets.QMainWindow):
+class MainWindow(PreviewVisibilityMixin, QtWidgets.QMainWindow):
     def __init__(
         self,
         controller: "AppController",
@@ -6815,7 +7478,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._current_page_index: int = -1
         self._flush_row_override: Optional[int] = None
+        self._page_filenames: set[str] = set()
         self._dirty: bool = False
+        self._window_title = ""
 
         self._ai_threads: List[QThread] = []
         self._ai_workers: List[QObject] = []
@@ -6823,12 +7488,49 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ai_prompt: Optional[QtWidgets.QPlainTextEdit] = None
         self.ai_output: Optional[QtWidgets.QPlainTextEdit] = None
 
-        self._preview_tmp: Optional[str] = None
+        # Removed by closeEvent, or by Qt when the window is destroyed.
+        self._preview_tmp: Optional[QtCore.QTemporaryDir] = None
+        # Set when a refresh was skipped because the preview could not be
+        # seen; the next show/restore/splitter move catches up.
+        self._preview_stale = False
         self._debounce = QtCore.QTimer(self)
-        self._debounce.setInterval(400)
+        self._debounce.setInterval(250)
         self._debounce.setSingleShot(True)
-        # Debounced auto-preview: call update_preview when timer fires
-        self._debounce.timeout.connect(self.update_preview)
+        # Debounced auto-preview: refresh when the timer fires and the editors
+        # hold something other than what was last rendered. The editors'
+        # document modified flags mark text not yet flushed to the model.
+        self._debounce.timeout.connect(self._on_preview_debounce)
+        self._preview_needs_full = True
+        # Set when flushing the editors actually changed the model.
+        self._model_dirty = False
+        self._css_blocks_cache: Tuple[str, Dict[str, str]] = ("", {})
+        # Source files of images imported this session, so edits made in
+        # another program flow back into the embedded copy.
+        self._asset_watcher = QtCore.QFileSystemWatcher(self)
+        self._asset_watcher.fileChanged.connect(self._on_asset_file_changed)
+        self._watched_assets: Dict[str, AssetImage] = {}
+        # Renders run one at a time on a private pool; _preview_seq tags each
+        # request so only the newest result is shown.
+        self._preview_pool = QtCore.QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.finished.connect(self._on_preview_rendered)
+        self._preview_signals.errored.connect(self._on_preview_failed)
+        self._preview_seq = 0
+        self._preview_request: Tuple[int, Optional[str], bool] = (0, None, False)
+        # (page content, CSS key, uses scripts) behind the pending request,
+        # and (filename, (head, tail), content, CSS key) of the document in
+        # the view, so body- or CSS-only edits can be patched in place.
+        self._preview_source: Tuple[str, object, bool] = ("", None, True)
+        self._preview_doc: Optional[Tuple[str, Tuple[str, str], str, object]] = None
+        self._preview_loading = False
+        # CSS key of the stylesheet in the preview dir; None while unknown.
+        self._css_on_disk: object = None
+        # Saves and exports run here, one at a time; _edit_serial lets a save
+        # that finishes after further edits leave the window dirty.
+        self._io_pool = QtCore.QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        self._edit_serial = 0
         self._last_cover_palette_hash: str = ""
         self._last_cover_content_hash: str = ""
 
@@ -6842,6 +7544,8 @@ class MainWindow(QtWidgets.QMainWindow):
     # UI setup ----------------------------------------------------------
     def set_dirty(self, dirty: bool = True) -> None:
         self._dirty = dirty
+        if dirty:
+            self._edit_serial += 1
         self.update_window_title()
 
     def maybe_save_before(self, action_label: str) -> bool:
@@ -6865,7 +7569,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         clicked = box.clickedButton()
         if clicked is save_btn:
-            self.save_project()
+            self.save_project(wait=True)
             return not self._dirty
         if clicked is discard_btn:
             self.set_dirty(False)
@@ -6876,7 +7580,12 @@ class MainWindow(QtWidgets.QMainWindow):
         name = self.project.name if self.project else "Untitled"
         suffix = f" ({self.project_path.name})" if self.project_path else ""
         dirty = " •" if getattr(self, "_dirty", False) else ""
-        self.setWindowTitle(f"{APP_TITLE} — {name}{suffix}{dirty}")
+        title = f"{APP_TITLE} — {name}{suffix}{dirty}"
+        # set_dirty runs on every keystroke; only touch the native window
+        # when the text actually changes.
+        if title != self._window_title:
+            self._window_title = title
+            self.setWindowTitle(title)
 
     def _ensure_default_save_dir(self) -> Path:
         """Ensure and return the default save directory: Documents/MyWebsites.
@@ -6979,7 +7688,7 @@ class MainWindow(QtWidgets.QMainWindow):
         header.addWidget(self.btn_preview)
         left_layout.addLayout(header)
 
-        self.pages_list = QtWidgets.QListWidget(left)
+        self.pages_list = PageListView(left)
         self.pages_list.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
         left_layout.addWidget(self.pages_list, 1)
@@ -7019,17 +7728,26 @@ class MainWindow(QtWidgets.QMainWindow):
         right_layout.setContentsMargins(8, 8, 8, 8)
         right_layout.setSpacing(4)
         right_layout.addWidget(QtWidgets.QLabel("Preview"))
-        self.preview = QWebEngineView(right)
+        self.preview = new_web_view(right)
+        self.preview.loadStarted.connect(self._on_preview_load_started)
+        self.preview.loadFinished.connect(self._on_preview_load_finished)
         right_layout.addWidget(self.preview, 1)
 
         splitter.addWidget(left)
         splitter.addWidget(self.tab_editors)
         splitter.addWidget(right)
         splitter.setSizes([260, 620, 400])
+        splitter.splitterMoved.connect(lambda *_: self._resume_preview())
 
         status = QtWidgets.QStatusBar(self)
         self.setStatusBar(status)
         self.status_bar = status
+        self.io_progress = QtWidgets.QProgressBar(status)
+        self.io_progress.setRange(0, 0)
+        self.io_progress.setMaximumWidth(160)
+        self.io_progress.setTextVisible(False)
+        self.io_progress.hide()
+        status.addPermanentWidget(self.io_progress)
 
     def _build_design_tab(self) -> QtWidgets.QWidget:
         tab = QtWidgets.QWidget(self)
@@ -7506,89 +8224,51 @@ class MainWindow(QtWidgets.QMainWindow):
 
         insert_menu = bar.addMenu("&Insert")
         if insert_menu is not None:
-            self.menu_layouts = insert_menu.addMenu("Layouts")
-            if self.menu_layouts is not None:
-                for key, snippet in LAYOUT_SNIPPETS.items():
-                    action = QtGui.QAction(snippet.label, self)
-                    action.triggered.connect(
-                        lambda checked=False, lib=LAYOUT_SNIPPETS, item_key=key: self.insert_snippet(
-                            lib, item_key)
-                    )
-                    self.menu_layouts.addAction(action)
-            self.menu_sections = insert_menu.addMenu("Sections")
-            if self.menu_sections is not None:
-                for key, snippet in SECTIONS_SNIPPETS.items():
-                    action = QtGui.QAction(snippet.label, self)
-                    action.triggered.connect(
-                        lambda checked=False, lib=SECTIONS_SNIPPETS, item_key=key: self.insert_snippet(
-                            lib, item_key)
-                    )
-                    self.menu_sections.addAction(action)
-            self.menu_components = insert_menu.addMenu("Components")
-            if self.menu_components is not None:
-                for key, snippet in COMPONENT_SNIPPETS.items():
-                    action = QtGui.QAction(snippet.label, self)
-                    action.triggered.connect(
-                        lambda checked=False, lib=COMPONENT_SNIPPETS, item_key=key: self.insert_snippet(
-                            lib, item_key)
-                    )
-                    self.menu_components.addAction(action)
-            self.menu_effects = insert_menu.addMenu("Effects")
+            snippet_menus = [
+                ("Layouts", "menu_layouts", LAYOUT_SNIPPETS),
+                ("Sections", "menu_sections", SECTIONS_SNIPPETS),
+                ("Components", "menu_components", COMPONENT_SNIPPETS),
+                ("Effects", "menu_effects", EFFECT_SNIPPETS),
+            ]
+            for title, attr, library in snippet_menus:
+                submenu = insert_menu.addMenu(title)
+                setattr(self, attr, submenu)
+                if submenu is None:
+                    continue
+                submenu.triggered.connect(self._on_menu_action)
+                for key, snippet in library.items():
+                    self._add_menu_action(
+                        submenu, snippet.label,
+                        functools.partial(self.insert_snippet, library, key))
             if self.menu_effects is not None:
-                for key, snippet in EFFECT_SNIPPETS.items():
-                    action = QtGui.QAction(snippet.label, self)
-                    action.triggered.connect(
-                        lambda checked=False, lib=EFFECT_SNIPPETS, item_key=key: self.insert_snippet(
-                            lib, item_key)
-                    )
-                    self.menu_effects.addAction(action)
                 self.menu_effects.addSeparator()
-                act_blob = QtGui.QAction("Organic blob", self)
-                act_blob.triggered.connect(
-                    lambda checked=False: self.insert_graphic(svg_blob()))
-                self.menu_effects.addAction(act_blob)
-                act_dots = QtGui.QAction("Dots pattern", self)
-                act_dots.triggered.connect(
-                    lambda checked=False: self.insert_graphic(svg_dots()))
-                self.menu_effects.addAction(act_dots)
-                act_stripes = QtGui.QAction("Diagonal stripes", self)
-                act_stripes.triggered.connect(
-                    lambda checked=False: self.insert_graphic(svg_diagonal_stripes()))
-                self.menu_effects.addAction(act_stripes)
-                act_banner = QtGui.QAction("Gradient banner", self)
-                act_banner.triggered.connect(
-                    lambda checked=False: self.insert_graphic(
-                        '<div class="bg-gradient" style="width:100%;height:220px;"></div>'
-                    )
-                )
-                self.menu_effects.addAction(act_banner)
+                for label, markup in [
+                    ("Organic blob", svg_blob()),
+                    ("Dots pattern", svg_dots()),
+                    ("Diagonal stripes", svg_diagonal_stripes()),
+                    ("Gradient banner",
+                     '<div class="bg-gradient" style="width:100%;height:220px;"></div>'),
+                ]:
+                    self._add_menu_action(
+                        self.menu_effects, label,
+                        functools.partial(self.insert_graphic, markup))
             self.menu_animation = insert_menu.addMenu("Animation")
             if self.menu_animation is not None:
-                fade_up = QtGui.QAction("Wrap → anim-fade-up", self)
-                fade_up.triggered.connect(
-                    lambda checked=False: self.insert_animation_wrapper("anim-fade-up"))
-                fade_in = QtGui.QAction("Wrap → anim-fade-in", self)
-                fade_in.triggered.connect(
-                    lambda checked=False: self.insert_animation_wrapper("anim-fade-in"))
-                zoom_in = QtGui.QAction("Wrap → anim-zoom-in", self)
-                zoom_in.triggered.connect(
-                    lambda checked=False: self.insert_animation_wrapper("anim-zoom-in"))
-                self.menu_animation.addActions([fade_up, fade_in, zoom_in])
+                self.menu_animation.triggered.connect(self._on_menu_action)
+                for class_name in ("anim-fade-up", "anim-fade-in", "anim-zoom-in"):
+                    self._add_menu_action(
+                        self.menu_animation, f"Wrap → {class_name}",
+                        functools.partial(self.insert_animation_wrapper, class_name))
                 self.menu_animation.addSeparator()
-                classic_fade = QtGui.QAction("Legacy wrap → Fade in", self)
-                classic_fade.triggered.connect(
-                    lambda checked=False: self._apply_motion_wrapper("fade"))
-                classic_zoom = QtGui.QAction("Legacy wrap → Zoom in", self)
-                classic_zoom.triggered.connect(
-                    lambda checked=False: self._apply_motion_wrapper("zoom"))
-                classic_blur = QtGui.QAction("Legacy wrap → Blur in", self)
-                classic_blur.triggered.connect(
-                    lambda checked=False: self._apply_motion_wrapper("blur"))
-                loop_float = QtGui.QAction("Legacy loop → Float", self)
-                loop_float.triggered.connect(
-                    lambda checked=False: self._apply_motion_wrapper("float", loop=True))
-                self.menu_animation.addActions(
-                    [classic_fade, classic_zoom, classic_blur, loop_float])
+                for label, effect, loop in [
+                    ("Legacy wrap → Fade in", "fade", False),
+                    ("Legacy wrap → Zoom in", "zoom", False),
+                    ("Legacy wrap → Blur in", "blur", False),
+                    ("Legacy loop → Float", "float", True),
+                ]:
+                    self._add_menu_action(
+                        self.menu_animation, label,
+                        functools.partial(self._apply_motion_wrapper, effect, loop=loop))
 
         m_publish = bar.addMenu("&Publish")
         self.act_publish = QtGui.QAction("Publish…", self)
@@ -7598,11 +8278,11 @@ class MainWindow(QtWidgets.QMainWindow):
         m_resources = bar.addMenu("&Resources")
 
         if m_resources is not None:
+            m_resources.triggered.connect(self._on_menu_action)
+
             def add_link(caption: str, url: str) -> None:
-                act = QtGui.QAction(caption, self)
-                act.triggered.connect(
-                    lambda checked=False, link=url: open_url(link))
-                m_resources.addAction(act)
+                self._add_menu_action(
+                    m_resources, caption, functools.partial(open_url, url))
 
             add_link("MDN HTML reference",
                      "https://developer.mozilla.org/en-US/docs/Web/HTML/Reference")
@@ -7649,6 +8329,27 @@ class MainWindow(QtWidgets.QMainWindow):
             self.act_replay_intro.triggered.connect(_replay_intro)
             help_menu.addAction(self.act_replay_intro)
 
+    def _add_menu_action(
+        self,
+        menu: QtWidgets.QMenu,
+        label: str,
+        handler: Callable[[], object],
+    ) -> QtGui.QAction:
+        """Add an action whose handler is stored on the action itself.
+
+        The owning menu's ``triggered`` signal is wired to
+        :meth:`_on_menu_action`, so no per-action slot is connected.
+        """
+        action = QtGui.QAction(label, self)
+        action.setData(handler)
+        menu.addAction(action)
+        return action
+
+    def _on_menu_action(self, action: QtGui.QAction) -> None:
+        handler = action.data()
+        if callable(handler):
+            handler()
+
     def _bind_events(self) -> None:
         self.pages_list.currentRowChanged.connect(self._on_page_selected)
         self.html_editor.textChanged.connect(self._on_editor_changed)
@@ -7738,15 +8439,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self._refresh_pages_list()
         self._current_page_index = -1
         self._flush_row_override = None
-        self.html_editor.blockSignals(True)
-        if self.project.pages:
-            self.html_editor.setPlainText(self.project.pages[0].html)
-        else:
-            self.html_editor.clear()
-        self.html_editor.blockSignals(False)
-        self.css_editor.blockSignals(True)
-        self.css_editor.setPlainText(self.project.css)
-        self.css_editor.blockSignals(False)
+        self._set_editor_text(
+            self.html_editor,
+            self.project.pages[0].html if self.project.pages else "")
+        self._set_editor_text(self.css_editor, self.project.css)
         if self.project.backgrounds and BACKGROUND_BLOCK_START not in self.project.css:
             self._sync_background_css()
         if self.project.pages:
@@ -7786,11 +8482,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.motion_enable_scroll.setChecked(
             self.project.use_scroll_animations)
         self.motion_enable_scroll.blockSignals(False)
-        pref_label = next(
-            (label for label, value in MOTION_PREF_OPTIONS.items()
-             if value == self.project.motion_pref),
-            "Respect visitor setting",
-        )
+        pref_label = MOTION_PREF_LABELS.get(
+            self.project.motion_pref, "Respect visitor setting")
         self.motion_pref_combo.blockSignals(True)
         self.motion_pref_combo.setCurrentText(pref_label)
         self.motion_pref_combo.blockSignals(False)
@@ -7800,11 +8493,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.motion_effect_combo.blockSignals(True)
         self.motion_effect_combo.setCurrentText(effect_value)
         self.motion_effect_combo.blockSignals(False)
-        easing_label = next(
-            (label for label, value in MOTION_EASINGS.items()
-             if value == self.project.motion_default_easing),
-            "Gentle ease",
-        )
+        easing_label = MOTION_EASING_LABELS.get(
+            self.project.motion_default_easing, "Gentle ease")
         self.motion_easing_combo.blockSignals(True)
         self.motion_easing_combo.setCurrentText(easing_label)
         self.motion_easing_combo.blockSignals(False)
@@ -7824,10 +8514,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # Page management ---------------------------------------------------
     def _refresh_pages_list(self) -> None:
+        # Every page-list mutation ends here, so the filename index is rebuilt
+        # alongside the labels and add_page can look names up directly.
+        self._page_filenames = {page.filename for page in self.project.pages}
         self.pages_list.blockSignals(True)
-        self.pages_list.clear()
-        for page in self.project.pages:
-            self.pages_list.addItem(f"{page.title} ({page.filename})")
+        self.pages_list.set_labels(
+            [f"{page.title} ({page.filename})" for page in self.project.pages])
         self.pages_list.blockSignals(False)
 
     def new_project_bootstrap(self) -> None:
@@ -7880,7 +8572,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
         title, filename, html = dialog.result()
-        existing = {p.filename for p in self.project.pages}
+        existing = self._page_filenames
         if filename in existing:
             base = filename[:-5] if filename.endswith(".html") else filename
             counter = 1
@@ -7891,12 +8583,11 @@ class MainWindow(QtWidgets.QMainWindow):
             filename = new_filename
         self.project.pages.append(
             Page(filename=filename, title=title, html=html))
+        existing.add(filename)
         self._refresh_pages_list()
         self.pages_list.setCurrentRow(len(self.project.pages) - 1)
-        self.html_editor.blockSignals(True)
-        self.html_editor.setPlainText(html)
-        self.html_editor.blockSignals(False)
-        self.update_preview()
+        self._set_editor_text(self.html_editor, html)
+        self._schedule_preview()
         self.set_dirty(True)
 
     def remove_page(self) -> None:
@@ -7918,7 +8609,7 @@ class MainWindow(QtWidgets.QMainWindow):
         del self.project.pages[row]
         self._refresh_pages_list()
         self.pages_list.setCurrentRow(max(0, row - 1))
-        self.update_preview()
+        self._schedule_preview()
         self.set_dirty(True)
 
     def _on_page_selected(self, index: int) -> None:
@@ -7929,11 +8620,14 @@ class MainWindow(QtWidgets.QMainWindow):
             -1, index) else None
         self._flush_editors_to_model()
         page = self.project.pages[index]
-        self.html_editor.blockSignals(True)
-        self.html_editor.setPlainText(page.html)
-        self.html_editor.blockSignals(False)
+        self._set_editor_text(self.html_editor, page.html)
         self._current_page_index = index
-        self.update_preview()
+        if self._preview_is_current(page):
+            # Nothing changed since the last render: show the page already
+            # on disk instead of rendering the site again.
+            self._show_preview_page(page.filename)
+        else:
+            self._schedule_preview()
         self._load_background_controls()
 
     # Editing & preview -------------------------------------------------
@@ -7941,6 +8635,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self._debounce.start()
         self.set_dirty(True)
 
+    @staticmethod
+    def _set_editor_text(editor: QtWidgets.QPlainTextEdit, text: str) -> None:
+        """Load model text into ``editor`` without firing change handlers.
+
+        The document is marked unmodified: it now matches the model, so the
+        next flush can skip it.
+        """
+        with QtCore.QSignalBlocker(editor):
+            editor.setPlainText(text)
+        editor.document().setModified(False)
+
     def _flush_editors_to_model(self) -> None:
         if not self.project:
             return
@@ -7950,33 +8655,229 @@ class MainWindow(QtWidgets.QMainWindow):
             self._flush_row_override = None
         elif 0 <= self._current_page_index < len(self.project.pages):
             index = self._current_page_index
-        if 0 <= index < len(self.project.pages):
-            self.project.pages[index].html = self.html_editor.toPlainText()
-        self.project.css = self.css_editor.toPlainText()
+        # Only an editor whose document changed since the last flush (or
+        # load) is copied out; toPlainText() builds the whole text each time.
+        html_doc = self.html_editor.document()
+        if 0 <= index < len(self.project.pages) and html_doc.isModified():
+            html = self.html_editor.toPlainText()
+            if self.project.pages[index].html != html:
+                self.project.pages[index].html = html
+                self._model_dirty = True
+            html_doc.setModified(False)
+        css_doc = self.css_editor.document()
+        if css_doc.isModified():
+            css = self.css_editor.toPlainText()
+            if self.project.css != css:
+                self.project.css = css
+                self._model_dirty = True
+            css_doc.setModified(False)
+
+    def _editors_modified(self) -> bool:
+        # Undoing back to the last flush clears the flag again, so undo/redo
+        # round-trips read as unchanged.
+        return (self.html_editor.document().isModified()
+                or self.css_editor.document().isModified())
+
+    def _preview_dir(self) -> Path:
+        """Return the preview output directory, created once per window.
+
+        Renders overwrite it in place; on Linux it lives in /dev/shm so
+        preview writes never touch the disk.
+        """
+        tmp = self._preview_tmp
+        if tmp is None or not os.path.isdir(tmp.path()):
+            shm = "/dev/shm"
+            base = shm if sys.platform.startswith(
+                "linux") and os.access(shm, os.W_OK) else QtCore.QDir.tempPath()
+            tmp = QtCore.QTemporaryDir(
+                os.path.join(base, "webineer_preview_XXXXXX"))
+            if not tmp.isValid():
+                raise OSError(tmp.errorString())
+            self._preview_tmp = tmp
+        return Path(tmp.path())
+
+    def _preview_is_current(self, page: Page) -> bool:
+        """True when the preview dir already holds an up-to-date *page*."""
+        return (not self._model_dirty and not self._preview_needs_full
+                and not self._debounce.isActive()
+                and self._preview_pool.activeThreadCount() == 0
+                and self._preview_tmp is not None
+                and (Path(self._preview_tmp.path()) / page.filename).exists())
+
+    def _show_preview_page(self, filename: str) -> None:
+        url = QtCore.QUrl.fromLocalFile(str(self._preview_dir() / filename))
+        # Invalidate any pending result so it cannot replace this page.
+        self._preview_seq += 1
+        self._preview_request = (self._preview_seq, filename, False)
+        self._preview_doc = None
+        self.preview.setUrl(url)
+
+    def _schedule_preview(self) -> None:
+        """Coalesce model changes into the next debounced preview refresh."""
+        self._preview_needs_full = True
+        self._debounce.start()
 
-    def update_preview(self, open_external: bool = False) -> None:
+    def _on_preview_debounce(self) -> None:
+        if self._preview_needs_full:
+            self.update_preview()
+            return
+        # Undo/redo round-trips and no-op edits leave the text as rendered.
+        if not self._model_dirty and not self._editors_modified():
+            return
+        # Only the editors changed: re-render the current page and stylesheet.
+        self.update_preview(incremental=True)
+
+    def _catch_up_preview(self) -> None:
+        self._on_preview_debounce()
+
+    def update_preview(self, open_external: bool = False,
+                       incremental: bool = False) -> None:
         if not self.project:
             return
         self._flush_editors_to_model()
-        if self._preview_tmp and os.path.isdir(self._preview_tmp):
-            shutil.rmtree(self._preview_tmp, ignore_errors=True)
-        self._preview_tmp = tempfile.mkdtemp(prefix="webineer_preview_")
-        render_site(self.project, Path(self._preview_tmp))
+        if not open_external and self._preview_hidden():
+            # Nothing would be shown; remember what the catch-up must cover.
+            if not incremental:
+                self._preview_needs_full = True
+            self._preview_stale = True
+            return
+        preview_dir = self._preview_dir()
         index = self.pages_list.currentRow()
         if index < 0 and self.project.pages:
             index = 0
-        if 0 <= index < len(self.project.pages):
-            page = self.project.pages[index]
-            file_path = Path(self._preview_tmp) / page.filename
-            self.preview.setUrl(QtCore.QUrl.fromLocalFile(str(file_path)))
+        page = self.project.pages[index] if 0 <= index < len(
+            self.project.pages) else None
+        only_page: Optional[Page] = None
+        if incremental and page is not None and (
+                preview_dir / page.filename).exists():
+            only_page = page
+        else:
+            self._preview_needs_full = False
+        self._model_dirty = False
+        self._preview_seq += 1
+        self._preview_request = (
+            self._preview_seq, page.filename if page else None, open_external)
+        # Anything still queued is stale now; a running job finishes and is
+        # ignored when its sequence number comes back.
+        self._preview_pool.clear()
+        snapshot = self.project.snapshot()
+        snapshot_page = None
+        if only_page is not None:
+            snapshot_page = snapshot.pages[index]
+        css_key = (snapshot.css, tuple(sorted(snapshot.gradients.items())),
+                   snapshot.motion_pref)
+        self._preview_source = (
+            snapshot.pages[index].html if page is not None else "",
+            css_key,
+            snapshot.use_main_js or snapshot.use_scroll_animations
+            or any(asset.kind == "js" for asset in snapshot.external),
+        )
+        # HTML-only edits leave the stylesheet on disk alone. A job that may
+        # rewrite it makes the on-disk version unknown until it reports back.
+        write_css = snapshot_page is None or css_key != self._css_on_disk
+        if write_css:
+            self._css_on_disk = None
+        self._preview_pool.start(_PreviewRenderJob(
+            self._preview_seq, snapshot, preview_dir, snapshot_page,
+            self._preview_signals, write_css))
+
+    def _on_preview_rendered(self, seq: int, rendered: Dict[str, str]) -> None:
+        request_seq, filename, open_external = self._preview_request
+        if seq != request_seq or not self.project or self._preview_tmp is None:
+            return
+        self._css_on_disk = self._preview_source[1]
+        if filename is not None:
+            file_path = Path(self._preview_tmp.path()) / filename
+            url = QtCore.QUrl.fromLocalFile(str(file_path))
+            html = rendered.get(filename, "")
+            if html and fits_set_html(html):
+                if not self._patch_preview(seq, filename, html, url):
+                    self._load_preview_html(filename, html, url)
+            else:
+                self._preview_doc = None
+                if self.preview.url() == url:
+                    self.preview.reload()
+                else:
+                    self.preview.setUrl(url)
             if open_external:
                 try:
+                    import webbrowser
+
                     webbrowser.open(str(file_path))
                 except Exception:
                     pass
         self.status_bar.showMessage("Preview updated", 1500)
         self._maybe_render_cover()
 
+    def _load_preview_html(self, filename: str, html: str,
+                           url: QtCore.QUrl) -> None:
+        # Hand the markup straight to the view; the base URL keeps relative
+        # asset and nav links pointing into the preview dir.
+        content, css_key, _ = self._preview_source
+        parts = _split_page_document(html, content)
+        self._preview_doc = (
+            filename, parts, content, css_key) if parts is not None else None
+        self._preview_loading = True
+        self.preview.setHtml(html, url)
+
+    def _patch_preview(self, seq: int, filename: str, html: str,
+                       url: QtCore.QUrl) -> bool:
+        """Update the shown page in place when only its body or CSS changed.
+
+        Swapping ``<body>`` contents and re-pointing the stylesheet link
+        keeps the scroll position and skips a full navigation. Pages that run
+        scripts are always reloaded, since replaced markup would miss the
+        handlers those scripts attach on load.
+        """
+        doc = self._preview_doc
+        content, css_key, scripted = self._preview_source
+        if (doc is None or doc[0] != filename or self._preview_loading
+                or scripted or "<script" in content.lower()):
+            return False
+        parts = _split_page_document(html, content)
+        if parts is None or parts != doc[1]:
+            return False
+        statements = []
+        if content != doc[2]:
+            inner = html[len(parts[0]):html.rfind("</body>")]
+            statements.append(f"document.body.innerHTML = {json.dumps(inner)};")
+        if css_key != doc[3]:
+            statements.append(
+                "document.querySelectorAll('link[rel=\"stylesheet\"]')"
+                ".forEach(function (link) {"
+                " if (link.getAttribute('href').split('?')[0] === 'assets/css/style.css')"
+                f" link.setAttribute('href', 'assets/css/style.css?v={seq}'); }});")
+        self._preview_doc = (filename, parts, content, css_key)
+        if not statements:
+            return True
+        body_class = _BODY_CLASS_RE.search(parts[0]).group(1)
+        script = (
+            "(function () {"
+            f" if (!document.body || document.body.className !== {json.dumps(body_class)})"
+            " return false; "
+            + " ".join(statements)
+            + " return true; })();"
+        )
+
+        def _patched(ok: object) -> None:
+            # The view moved to another document meanwhile: load the page.
+            if ok is not True and seq == self._preview_request[0]:
+                self._load_preview_html(filename, html, url)
+
+        self.preview.page().runJavaScript(script, 0, _patched)
+        return True
+
+    def _on_preview_load_started(self) -> None:
+        self._preview_loading = True
+
+    def _on_preview_load_finished(self, ok: bool) -> None:
+        self._preview_loading = False
+
+    def _on_preview_failed(self, seq: int, message: str) -> None:
+        if seq == self._preview_request[0]:
+            self._preview_needs_full = True
+            self.status_bar.showMessage(f"Preview failed: {message}", 5000)
+
     def _cover_signatures(self) -> Tuple[str, str]:
         if not self.project:
             return "", ""
@@ -7989,8 +8890,8 @@ class MainWindow(QtWidgets.QMainWindow):
             "cover_asset": self.project.cover_asset_name or "",
             "template": self.project.template_key,
         }
-        palette_hash = hashlib.sha1(json.dumps(
-            palette_payload, sort_keys=True).encode("utf-8")).hexdigest()
+        palette_hash = hashlib.sha1(json_dumps_bytes(
+            palette_payload, sort_keys=True)).hexdigest()
         first_html = self.project.pages[0].html if self.project.pages else ""
         css = self.project.css or ""
         content_hash = hashlib.sha1(
@@ -8032,7 +8933,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if snippet.requires_js:
             self.project.use_main_js = True
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
 
     def insert_graphic(self, markup: str) -> None:
         if not self.project:
@@ -8043,7 +8944,7 @@ class MainWindow(QtWidgets.QMainWindow):
         cursor.insertText(f"\n\n{markup.strip()}\n\n")
         self.html_editor.setTextCursor(cursor)
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Graphic inserted", 2000)
 
     def insert_animation_wrapper(self, class_name: str) -> None:
@@ -8060,7 +8961,7 @@ class MainWindow(QtWidgets.QMainWindow):
             )
         self.project.use_main_js = True
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage(f"Added {class_name} wrapper", 2000)
 
     def _background_scope_value(self) -> str:
@@ -8124,12 +9025,7 @@ class MainWindow(QtWidgets.QMainWindow):
         return removed
 
     def _strip_background_blocks(self, css: str) -> str:
-        pattern = re.compile(
-            re.escape(BACKGROUND_BLOCK_START) + r".*?" +
-            re.escape(BACKGROUND_BLOCK_END), re.S
-        )
-        cleaned = re.sub(pattern, "", css)
-        return cleaned.strip()
+        return _BACKGROUND_BLOCK_RE.sub("", css).strip()
 
     def _sync_background_css(self) -> None:
         css = self.css_editor.toPlainText()
@@ -8141,9 +9037,7 @@ class MainWindow(QtWidgets.QMainWindow):
             combined = f"{BACKGROUND_BLOCK_START}\n" + \
                 "\n\n".join(blocks) + f"\n{BACKGROUND_BLOCK_END}"
             css = (css + "\n\n" + combined).strip() if css else combined
-        self.css_editor.blockSignals(True)
-        self.css_editor.setPlainText(css)
-        self.css_editor.blockSignals(False)
+        self._set_editor_text(self.css_editor, css)
         self.project.css = css
 
     def _build_background_block(self, spec: BackgroundSpec) -> Optional[str]:
@@ -8182,7 +9076,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 svg = value.get("svg", "")
                 if not svg:
                     return None
-                encoded = urllib.parse.quote(svg, safe="")
+                encoded = svg_url_quote(svg)
                 return (
                     f"{BACKGROUND_COMMENT_PREFIX} (site/pattern) */\n"
                     "body::before {\n  content:\"\"; position:fixed; inset:0; z-index:-1;\n"
@@ -8223,7 +9117,7 @@ class MainWindow(QtWidgets.QMainWindow):
             svg = value.get("svg", "")
             if not svg:
                 return None
-            encoded = urllib.parse.quote(svg, safe="")
+            encoded = svg_url_quote(svg)
             return (
                 f"{BACKGROUND_COMMENT_PREFIX} (page/pattern) */\n"
                 f".{class_name} {{ background-image: url('data:image/svg+xml,{encoded}'); background-repeat: repeat; }}"
@@ -8275,7 +9169,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         if scope == "page" and page_filename:
             value["page"] = page_filename
-            slug = slugify(Path(page_filename).stem)
+            slug = slugify(os.path.splitext(page_filename)[0])
             value.setdefault("class", f"page-bg-{slug}")
         spec = BackgroundSpec(scope=scope, kind=kind, value=value)
         self._store_background_spec(spec, page_filename)
@@ -8287,7 +9181,7 @@ class MainWindow(QtWidgets.QMainWindow):
             else:
                 self._ensure_background_comment(spec)
         self._load_background_controls()
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Background updated", 2500)
 
     def _reset_background_from_ui(self) -> None:
@@ -8305,7 +9199,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._sync_background_css()
         self.set_dirty(True)
         self._load_background_controls()
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Background removed", 2000)
 
     def _on_background_kind_changed(self, index: int) -> None:
@@ -8465,6 +9359,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_background_pattern_preview()
 
     # Theme helpers -----------------------------------------------------
+    def _css_blocks(self, css: str) -> Dict[str, str]:
+        """Sentinel blocks of ``css``, rescanned only when the text changes."""
+        cached_css, blocks = self._css_blocks_cache
+        if css != cached_css:
+            blocks = split_css_blocks(css)
+            self._css_blocks_cache = (css, blocks)
+        return blocks
+
     def _compose_css(
         self,
         *,
@@ -8473,28 +9375,30 @@ class MainWindow(QtWidgets.QMainWindow):
     ) -> str:
         if not self.project:
             return ""
-        current_css = self.css_editor.toPlainText()
-        helper_block = helper_override or extract_css_block(
-            current_css, CSS_HELPERS_SENTINEL) or CSS_HELPERS_BLOCK
+        blocks = self._css_blocks(self.css_editor.toPlainText())
+        helper_block = helper_override or blocks.get(
+            CSS_HELPERS_SENTINEL) or CSS_HELPERS_BLOCK
         extra_block = extra_override
         if extra_block is None:
-            extra_block = extract_css_block(
-                current_css, TEMPLATE_EXTRA_SENTINEL)
+            extra_block = blocks.get(TEMPLATE_EXTRA_SENTINEL) or None
         base_css = generate_base_css(
             self.project.palette,
             self.project.fonts,
             self.project.radius_scale,
             self.project.shadow_level,
         )
-        css = ensure_block(base_css, CSS_HELPERS_SENTINEL, helper_block)
-        css = ensure_block(css, BG_HELPERS_SENTINEL, BG_HELPERS_BLOCK)
-        css = ensure_block(css, GRADIENT_HELPERS_SENTINEL,
-                           gradient_helpers_block(self.project.gradients))
-        css = ensure_block(css, ANIM_HELPERS_SENTINEL,
-                           animation_helpers_block(self.project.motion_pref))
+        helper_blocks = [
+            (CSS_HELPERS_SENTINEL, helper_block),
+            (BG_HELPERS_SENTINEL, BG_HELPERS_BLOCK),
+            (GRADIENT_HELPERS_SENTINEL,
+             gradient_helpers_block(self.project.gradients)),
+            (ANIM_HELPERS_SENTINEL,
+             animation_helpers_block(self.project.motion_pref)),
+        ]
         if extra_block:
-            css = ensure_block(css, TEMPLATE_EXTRA_SENTINEL,
-                               f"{TEMPLATE_EXTRA_SENTINEL}\n{extra_block}")
+            helper_blocks.append((TEMPLATE_EXTRA_SENTINEL,
+                                  f"{TEMPLATE_EXTRA_SENTINEL}\n{extra_block}"))
+        css = ensure_blocks(base_css, helper_blocks)
         css = self._strip_background_blocks(css)
         if self.project.backgrounds:
             blocks = [self._build_background_block(
@@ -8520,10 +9424,10 @@ class MainWindow(QtWidgets.QMainWindow):
         }
         theme = self.design_theme_combo.currentText()
         current_css = self.css_editor.toPlainText()
-        helper_block = extract_css_block(
-            current_css, CSS_HELPERS_SENTINEL) or CSS_HELPERS_BLOCK
-        existing_extra = extract_css_block(
-            current_css, TEMPLATE_EXTRA_SENTINEL)
+        applied = self._theme_signature(current_css)
+        blocks = self._css_blocks(current_css)
+        helper_block = blocks.get(CSS_HELPERS_SENTINEL) or CSS_HELPERS_BLOCK
+        existing_extra = blocks.get(TEMPLATE_EXTRA_SENTINEL) or None
         clean_extra = strip_theme_extras(existing_extra)
         style = THEME_STYLE_PRESETS.get(theme)
         if theme in THEME_PRESETS:
@@ -8584,14 +9488,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self.design_body_font.setCurrentText(fonts.get("body", ""))
         css = self._compose_css(
             extra_override=clean_extra or None, helper_override=helper_block)
+        if self._theme_signature(css) == applied:
+            # Same palette, fonts and stylesheet as before: skip the editor
+            # reset and the full-site preview it would trigger.
+            self.status_bar.showMessage("Theme already applied", 4000)
+            return
         self.css_editor.setPlainText(css)
         self.project.css = css
         self._update_color_swatches()
         self._update_gradient_preview()
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Theme applied", 4000)
 
+    def _theme_signature(self, css: str) -> Tuple[object, ...]:
+        project = self.project
+        if not project:
+            return (css,)
+        return (dict(project.palette), dict(project.fonts),
+                project.theme_preset, project.radius_scale,
+                project.shadow_level, dict(project.gradients or {}), css)
+
     def add_css_helpers(self) -> None:
         css = self.css_editor.toPlainText()
         updated = ensure_block(css, CSS_HELPERS_SENTINEL, CSS_HELPERS_BLOCK)
@@ -8602,7 +9519,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self.css_editor.setPlainText(updated)
         self.project.css = updated
-        self.update_preview()
+        self._schedule_preview()
         self.set_dirty(True)
 
     def apply_gradient_helpers(self) -> None:
@@ -8620,7 +9537,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.project.css = css
         self._update_gradient_preview()
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Gradient helpers updated", 3000)
 
     def insert_gradient_hero(self) -> None:
@@ -8634,7 +9551,7 @@ class MainWindow(QtWidgets.QMainWindow):
             snippet = """\n\n<section class="hero bg-gradient text-on-gradient">\n  <h2>Gradient hero</h2>\n  <p>Add your pitch here.</p>\n  <a class="btn btn-gradient" href="#">Call to action</a>\n</section>\n\n"""
             cursor.insertText(snippet)
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Gradient hero inserted", 2500)
 
     def _update_color_swatches(self) -> None:
@@ -8669,7 +9586,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.css_editor.setPlainText(css)
         self.project.css = css
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Radius scale updated", 2000)
 
     def _on_shadow_level_changed(self, value: str) -> None:
@@ -8680,7 +9597,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.css_editor.setPlainText(css)
         self.project.css = css
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Shadow level updated", 2000)
 
     def _toggle_scroll_animations(self, enabled: bool) -> None:
@@ -8688,7 +9605,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self.project.use_scroll_animations = bool(enabled)
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         message = "Scroll animations enabled" if enabled else "Scroll animations disabled"
         self.status_bar.showMessage(message, 2500)
 
@@ -8702,7 +9619,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.css_editor.setPlainText(css)
         self.project.css = css
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Motion preference updated", 2500)
 
     def _on_motion_defaults_changed(self) -> None:
@@ -8748,7 +9665,7 @@ class MainWindow(QtWidgets.QMainWindow):
             prefix = f'<div class="{classes}"{self._motion_style_inline()}>'
         self.wrap_selection_with(prefix, "</div>")
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("Animation wrapper applied", 2500)
 
     def wrap_selection_default_motion(self) -> None:
@@ -8873,7 +9790,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.project.external.append(asset)
         self._refresh_external_assets_table(len(self.project.external) - 1)
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("External asset added", 2000)
 
     def _selected_external_rows(self) -> List[int]:
@@ -8897,7 +9814,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self._refresh_external_assets_table(new_index)
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("External assets reordered", 2000)
 
     def _remove_external_asset(self, row: int) -> None:
@@ -8921,7 +9838,7 @@ class MainWindow(QtWidgets.QMainWindow):
                        1) if self.project.external else None
         self._refresh_external_assets_table(next_row)
         self.set_dirty(True)
-        self.update_preview()
+        self._schedule_preview()
         self.status_bar.showMessage("External asset removed", 2000)
 
     def _download_external_asset(self) -> None:
@@ -8949,7 +9866,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._refresh_external_assets_table(rows[0])
         if changed:
             self.set_dirty(True)
-            self.update_preview()
+            self._schedule_preview()
             self.status_bar.showMessage(
                 "Downloaded external assets for offline use", 3000)
         if errors:
@@ -8968,6 +9885,11 @@ class MainWindow(QtWidgets.QMainWindow):
         if asset.mode != "cdn":
             return False, None
         url = asset.href
+        # urllib.request pulls in http.client and email; load it on first
+        # download rather than at startup.
+        import urllib.error
+        import urllib.request
+
         try:
             with urllib.request.urlopen(url) as response:
                 data = response.read()
@@ -8994,14 +9916,15 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.project:
             return filename
         normalized_kind = "css" if kind == "css" else "js"
-        suffix = Path(filename).suffix.lower()
+        raw_base, suffix = os.path.splitext(os.path.basename(filename))
+        suffix = suffix.lower()
         if suffix not in {".css", ".js"}:
             suffix = ".css" if normalized_kind == "css" else ".js"
-        raw_base = Path(filename).stem or f"{normalized_kind}-asset"
+        raw_base = raw_base or f"{normalized_kind}-asset"
         base_slug = slugify(raw_base) or f"{normalized_kind}-asset"
         candidate = f"{base_slug}{suffix}"
         existing = {
-            Path(item.href).name
+            os.path.basename(item.href)
             for idx, item in enumerate(self.project.external)
             if item.mode == "local" and (exclude_index is None or idx != exclude_index)
         }
@@ -9013,12 +9936,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # Asset management --------------------------------------------------
     def _refresh_assets(self) -> None:
-        self.asset_list.clear()
-        for asset in self.project.images:
-            item = QtWidgets.QListWidgetItem(
-                f"{asset.name} ({asset.width}×{asset.height})")
-            item.setData(Qt.ItemDataRole.UserRole, asset)
-            self.asset_list.addItem(item)
+        # Rebuild with repaints and row signals held, then sync the preview once.
+        self.asset_list.setUpdatesEnabled(False)
+        self.asset_list.blockSignals(True)
+        try:
+            # Update rows in place; only the tail is added or taken.
+            images = self.project.images
+            for row, asset in enumerate(images):
+                label = f"{asset.name} ({asset.width}×{asset.height})"
+                item = self.asset_list.item(row)
+                if item is None:
+                    item = QtWidgets.QListWidgetItem(label)
+                    self.asset_list.addItem(item)
+                elif item.text() != label:
+                    item.setText(label)
+                item.setData(Qt.ItemDataRole.UserRole, asset)
+            while self.asset_list.count() > len(images):
+                self.asset_list.takeItem(self.asset_list.count() - 1)
+        finally:
+            self.asset_list.blockSignals(False)
+            self.asset_list.setUpdatesEnabled(True)
+        self._show_asset_preview(self.asset_list.currentRow())
 
     def _browse_assets(self) -> None:
         paths, _ = QtWidgets.QFileDialog.getOpenFileNames(
@@ -9034,18 +9972,69 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _import_assets(self, paths: List[str]) -> None:
         added = 0
+        duplicates = 0
+        # A file is a duplicate when its resolved path is the source of an
+        # image still in the project; the same bytes under another name
+        # (logo.png / logo-dark.png) are a separate image. The sets are kept
+        # in step with the images appended below.
+        in_project = {id(asset) for asset in self.project.images}
+        imported = {source for source, asset in self._watched_assets.items()
+                    if id(asset) in in_project}
+        names = {asset.name for asset in self.project.images}
         for path_str in paths:
-            path = Path(path_str)
-            asset = self._asset_from_file(path)
+            source = str(Path(path_str).resolve())
+            if source in imported:
+                duplicates += 1
+                continue
+            asset = self._asset_from_file(Path(source))
             if asset:
-                asset.name = self._unique_asset_name(asset.name)
+                asset.name = self._unique_asset_name(asset.name, existing=names)
                 self.project.images.append(asset)
+                imported.add(source)
+                names.add(asset.name)
+                self._watch_asset_source(source, asset)
                 added += 1
+        skipped = (f"{duplicates} image(s) already imported"
+                   if duplicates else "")
+        # Re-adding files the project already holds changes nothing, so
+        # there is nothing to refresh or re-render; just say so.
         if added:
             self.set_dirty(True)
             self._refresh_assets()
-            self.status_bar.showMessage(f"Added {added} asset(s)", 3000)
-            self.update_preview()
+            message = f"Added {added} asset(s)"
+            self.status_bar.showMessage(
+                f"{message}; {skipped}" if skipped else message, 3000)
+            self._schedule_preview()
+        elif skipped:
+            self.status_bar.showMessage(f"Nothing added: {skipped}", 3000)
+
+    def _watch_asset_source(self, path: str, asset: AssetImage) -> None:
+        self._watched_assets[path] = asset
+        if path not in self._asset_watcher.files():
+            self._asset_watcher.addPath(path)
+
+    def _on_asset_file_changed(self, path: str) -> None:
+        asset = self._watched_assets.get(path)
+        if asset is None or not self.project or not any(
+                image is asset for image in self.project.images):
+            self._watched_assets.pop(path, None)
+            self._asset_watcher.removePath(path)
+            return
+        if os.path.exists(path) and path not in self._asset_watcher.files():
+            # Editors that save by replacing the file drop the watch.
+            self._asset_watcher.addPath(path)
+        if QtGui.QImage(path).isNull():
+            # Missing or half-written; the next change signal will retry.
+            return
+        fresh = self._asset_from_file(Path(path))
+        if fresh is None or fresh.data_base64 == asset.data_base64:
+            return
+        asset.data_base64 = fresh.data_base64
+        asset.width, asset.height, asset.mime = fresh.width, fresh.height, fresh.mime
+        self.set_dirty(True)
+        self._refresh_assets()
+        self.status_bar.showMessage(f"Updated {asset.name} from disk", 3000)
+        self._schedule_preview()
 
     def _asset_from_file(self, path: Path) -> Optional[AssetImage]:
         if not path.exists():
@@ -9068,13 +10057,15 @@ class MainWindow(QtWidgets.QMainWindow):
             mime = "image/svg+xml"
         return AssetImage(name=path.name, data_base64=data, width=image.width(), height=image.height(), mime=mime)
 
-    def _unique_asset_name(self, name: str, exclude: Optional[str] = None) -> str:
-        existing = {
-            asset.name for asset in self.project.images if asset.name != exclude}
+    def _unique_asset_name(self, name: str, exclude: Optional[str] = None,
+                           *, existing: Optional[set] = None) -> str:
+        if existing is None:
+            existing = {
+                asset.name for asset in self.project.images if asset.name != exclude}
         if name not in existing:
             return name
-        base = Path(name).stem
-        ext = Path(name).suffix or ".png"
+        base, ext = os.path.splitext(name)
+        ext = ext or ".png"
         counter = 1
         candidate = f"{base}-{counter}{ext}"
         while candidate in existing:
@@ -9119,7 +10110,7 @@ class MainWindow(QtWidgets.QMainWindow):
         del self.project.images[row]
         self._refresh_assets()
         self.asset_preview.setPixmap(QtGui.QPixmap())
-        self.update_preview()
+        self._schedule_preview()
         self.set_dirty(True)
 
     def _insert_image_dialog(self) -> None:
@@ -9148,7 +10139,7 @@ class MainWindow(QtWidgets.QMainWindow):
         cursor = self.html_editor.textCursor()
         cursor.insertText(html)
         self.html_editor.setTextCursor(cursor)
-        self.update_preview()
+        self._schedule_preview()
 
     def _set_cover_image_from_asset(self) -> None:
         if not self.project or not self.project.images:
@@ -9203,8 +10194,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.set_dirty(True)
         self.status_bar.showMessage(
             f"Placeholder {width}×{height} added", 4000)
-        data_uri = "data:image/svg+xml;base64," + \
-            base64.b64encode(svg.encode("utf-8")).decode("ascii")
+        data_uri = "data:image/svg+xml;base64," + data
         clipboard = QtWidgets.QApplication.clipboard()
         if clipboard is not None:
             clipboard.setText(data_uri)
@@ -9248,30 +10238,65 @@ class MainWindow(QtWidgets.QMainWindow):
         elif tile_path:
             self.recents.set_thumbnail(self.project_path, tile_path)
 
-    def save_project(self) -> None:
+    def _start_io_job(self, task: Callable[[], object],
+                      on_finished: Callable[[bool, str], None],
+                      *, wait: bool = False) -> None:
+        signals = _IOJobSignals(self)
+        signals.finished.connect(on_finished)
+        signals.finished.connect(signals.deleteLater)
+        job = _IOJob(task, signals)
+        if wait:
+            # Callers that need the outcome right away (save before quitting)
+            # run inline once any queued save or export has landed.
+            self._io_pool.waitForDone()
+            job.run()
+        else:
+            self._io_pool.start(job)
+
+    def _set_io_busy(self, busy: bool, message: str = "") -> None:
+        for action in (self.act_save, self.act_save_as, self.act_export):
+            action.setEnabled(not busy)
+        self.io_progress.setVisible(busy)
+        if busy and message:
+            self.status_bar.showMessage(message)
+
+    def save_project(self, *, wait: bool = False) -> None:
         if self.project_path is None:
-            self.save_project_as()
+            self.save_project_as(wait=wait)
             return
         self._flush_editors_to_model()
         self._maybe_render_cover(force=True)
-        try:
-            save_project(self.project_path, self.project)
-        except Exception as exc:
+        path = self.project_path
+        snapshot = self.project.snapshot()
+        self._set_io_busy(True, "Saving…")
+        self._start_io_job(
+            functools.partial(save_project, path, snapshot),
+            functools.partial(self._on_project_saved, path, self._edit_serial),
+            wait=wait)
+
+    def _on_project_saved(self, path: Path, serial: int,
+                          ok: bool, error: str) -> None:
+        self._set_io_busy(False)
+        if not ok:
+            self.status_bar.clearMessage()
             QtWidgets.QMessageBox.critical(
-                self, "Error", f"Could not save:\n{exc}")
+                self, "Error", f"Could not save:\n{error}")
             return
         self.status_bar.showMessage("Project saved", 2000)
-        self.recents.add_or_bump(self.project_path, self.project)
+        if not self.project or path != self.project_path:
+            return
+        self.recents.add_or_bump(path, self.project)
         tile_path = Path(
             self.project.cover_tile_path) if self.project.cover_tile_path else None
         if self.project.cover_path:
-            self.recents.set_cover(self.project_path, Path(
+            self.recents.set_cover(path, Path(
                 self.project.cover_path), tile_path=tile_path)
         elif tile_path:
-            self.recents.set_thumbnail(self.project_path, tile_path)
-        self.set_dirty(False)
+            self.recents.set_thumbnail(path, tile_path)
+        if serial == self._edit_serial:
+            self.set_dirty(False)
 
-    def save_project_as(self) -> None:
+    def save_project_as(self, *, wait: bool = False) -> None:
         default_save = (self.project_path or (
             self._ensure_default_save_dir() / "MySite.siteproj"))
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -9287,7 +10312,7 @@ class MainWindow(QtWidgets.QMainWindow):
             path_obj = path_obj.with_suffix(".siteproj")
         self.project_path = path_obj
         self.project.output_dir = str(path_obj.parent)
-        self.save_project()
+        self.save_project(wait=wait)
 
     def export_project(self) -> None:
         self._flush_editors_to_model()
@@ -9299,10 +10324,17 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not out_dir:
             return
-        try:
-            render_project(self.project, Path(out_dir))
-        except Exception as exc:
-            QtWidgets.QMessageBox.critical(self, "Export failed", str(exc))
+        self._set_io_busy(True, "Exporting…")
+        self._start_io_job(
+            functools.partial(
+                render_project, self.project.snapshot(), Path(out_dir)),
+            functools.partial(self._on_site_exported, out_dir))
+
+    def _on_site_exported(self, out_dir: str, ok: bool, error: str) -> None:
+        self._set_io_busy(False)
+        self.status_bar.clearMessage()
+        if not ok:
+            QtWidgets.QMessageBox.critical(self, "Export failed", error)
             return
         self.status_bar.showMessage(f"Exported to {out_dir}", 4000)
         QtWidgets.QMessageBox.information(
@@ -9323,22 +10355,21 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         if not out_zip.lower().endswith(".zip"):
             out_zip += ".zip"
-        tmp_dir = tempfile.mkdtemp(prefix="webineer_publish_")
-        try:
-            render_project(self.project, Path(tmp_dir))
-            with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                for root, _, files in os.walk(tmp_dir):
-                    for filename in files:
-                        file_path = os.path.join(root, filename)
-                        arcname = os.path.relpath(file_path, tmp_dir)
-                        zf.write(file_path, arcname)
-            QtWidgets.QMessageBox.information(
-                self, "ZIP created", f"Archive saved to:\n{out_zip}")
-        except Exception as exc:
+        self._set_io_busy(True, "Creating ZIP…")
+        self._start_io_job(
+            functools.partial(
+                export_project_zip, self.project.snapshot(), Path(out_zip)),
+            functools.partial(self._on_zip_exported, out_zip))
+
+    def _on_zip_exported(self, out_zip: str, ok: bool, error: str) -> None:
+        self._set_io_busy(False)
+        self.status_bar.clearMessage()
+        if not ok:
             QtWidgets.QMessageBox.critical(
-                self, "Error", f"ZIP export failed:\n{exc}")
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+                self, "Error", f"ZIP export failed:\n{error}")
+            return
+        QtWidgets.QMessageBox.information(
+            self, "ZIP created", f"Archive saved to:\n{out_zip}")
 
     def open_publish_dialog(self) -> None:
         dlg = PublishDialog(self)
@@ -9463,14 +10494,19 @@ class MainWindow(QtWidgets.QMainWindow):
 <p>Need inspiration? Try the "Make it for me" button on the start page.</p>
 </body></html>
 """
+        self._preview_doc = None
         self.preview.setHtml(html)
 
     def closeEvent(self, event: QCloseEvent) -> None:
         if not self.maybe_save_before("quitting"):
             event.ignore()
             return
-        if self._preview_tmp and os.path.isdir(self._preview_tmp):
-            shutil.rmtree(self._preview_tmp, ignore_errors=True)
+        # Let an in-flight save or export finish writing before exit.
+        self._io_pool.waitForDone()
+        self._preview_pool.clear()
+        self._preview_pool.waitForDone(5000)
+        if self._preview_tmp is not None:
+            self._preview_tmp.remove()
         event.accept()
 
     def show_tab(self, name: str) -> None:
@@ -9665,6 +10701,10 @@ def main() -> int:
     # Version-aware reset (runs on every startup; clears only when version changed)
     reset_if_new_install_or_version()
 
+    # Qt WebEngine is imported after the application exists (see
+    # new_web_view), which requires shared GL contexts to be enabled first.
+    QtCore.QCoreApplication.setAttribute(
+        Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("Webineer")
     splash = show_splash_and_fade(app)
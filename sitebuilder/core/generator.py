@@ -2,19 +2,81 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, NamedTuple, Sequence
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
 
-from .models import Project
+from webineer_common import (
+    asset_write_is_current,
+    remember_asset_write,
+    render_template,
+    write_if_changed,
+)
 
+from .models import Asset, Project
 
-def _env(templates_dir: Path) -> Environment:
-    return Environment(
+try:  # pragma: no cover - optional dependency
+    import pybase64 as base64  # type: ignore
+except Exception:  # pragma: no cover - stdlib fallback
+    import base64
+
+RENDER_WORKERS = min(8, os.cpu_count() or 4)
+
+_ASSET_SUBDIRS = {
+    "images": "images",
+    "fonts": "fonts",
+    "media": "media",
+    "js": "js",
+}
+
+
+class NavItem(NamedTuple):
+    """Navigation entry passed to the page template as ``pages``."""
+
+    filename: str
+    title: str
+
+
+def _run_parallel(func: Callable[..., None], items: Sequence) -> None:
+    """Apply ``func`` to every item, using a thread pool for more than one."""
+    if len(items) <= 1:
+        for item in items:
+            func(item)
+        return
+    with ThreadPoolExecutor(max_workers=min(RENDER_WORKERS, len(items))) as pool:
+        list(pool.map(func, items))
+
+
+@functools.lru_cache(maxsize=None)
+def _base_template(templates_dir: Path) -> Template:
+    """Return the compiled base template for ``templates_dir``, built once.
+
+    Compiled bytecode is shared through Jinja's per-user temp cache, so later
+    runs load it instead of re-parsing the source.
+    """
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError):  # no usable per-user temp dir
+        bytecode_cache = None
+    env = Environment(
         loader=FileSystemLoader(str(templates_dir)),
         autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=bytecode_cache,
     )
+    return env.get_template("base.html.j2")
 
 
 def render_site(project: Project, output_dir: str | Path, templates_dir: Path) -> None:
@@ -26,38 +88,40 @@ def render_site(project: Project, output_dir: str | Path, templates_dir: Path) -
     # Write CSS
     css_dir = assets_root / "css"
     css_dir.mkdir(parents=True, exist_ok=True)
-    (css_dir / "style.css").write_text(project.css, encoding="utf-8")
+    write_if_changed(css_dir / "style.css", project.css.encode("utf-8"))
 
     # Write binary assets bundled with the project
-    for asset in project.assets:
+    def write_asset(asset: Asset) -> None:
         if not asset.data_base64:
-            continue
-        dest_subdir = {
-            "images": "images",
-            "fonts": "fonts",
-            "media": "media",
-            "js": "js",
-        }.get(asset.kind, "files")
-        dest_dir = assets_root / dest_subdir
+            return
+        dest_dir = assets_root / _ASSET_SUBDIRS.get(asset.kind, "files")
         dest_dir.mkdir(parents=True, exist_ok=True)
+        target = dest_dir / asset.name
+        if asset_write_is_current(target, asset.data_base64):
+            return
         try:
             data = base64.b64decode(asset.data_base64.encode("ascii"))
-        except Exception:
-            continue
-        (dest_dir / asset.name).write_bytes(data)
-
-    env = _env(templates_dir)
-    tpl = env.get_template("base.html.j2")
-
-    nav = [{"filename": p.filename, "title": p.title} for p in project.pages]
-
-    for page in project.pages:
-        html = tpl.render(
-            site_name=project.name,
-            title=page.title,
-            pages=nav,
-            content=page.html,
-            stylesheet_path="assets/css/style.css",
-        )
-        (output_dir / page.filename).write_text(html, encoding="utf-8")
+        except (binascii.Error, ValueError):
+            return
+        write_if_changed(target, data)
+        remember_asset_write(target, asset.data_base64)
+
+    _run_parallel(write_asset, project.assets)
+
+    tpl = _base_template(Path(templates_dir))
+
+    rows = [(p.filename, p.title, p.html) for p in project.pages]
+    nav = [NavItem(filename, title) for filename, title, _ in rows]
+    common = {
+        "site_name": project.name,
+        "pages": nav,
+        "stylesheet_path": "assets/css/style.css",
+    }
+
+    def write_page(row: tuple[str, str, str]) -> None:
+        filename, title, body = row
+        html = render_template(tpl, {**common, "title": title, "content": body})
+        write_if_changed(output_dir / filename, html.encode("utf-8"))
+
+    _run_parallel(write_page, rows)
 
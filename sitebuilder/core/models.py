@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import List, Optional
 
+from webineer_common import adopt_str_fields, snapshot_copy
+
 
 @dataclass
 class Page:
@@ -12,6 +14,23 @@ class Page:
     title: str
     html: str
 
+    def to_dict(self) -> dict:
+        return {"filename": self.filename, "title": self.title, "html": self.html}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Page":
+        return cls(
+            filename=data.get("filename", ""),
+            title=data.get("title", ""),
+            html=data.get("html", ""),
+        )
+
+    @classmethod
+    def _adopt(cls, data: dict) -> "Page":
+        """Build a Page that takes ownership of a freshly parsed dict."""
+        page = adopt_str_fields(cls, data)
+        return page if page is not None else cls.from_dict(data)
+
 
 @dataclass
 class Asset:
@@ -46,19 +65,23 @@ class Project:
     version: int = 1
     assets: List[Asset] = field(default_factory=list)
 
+    def snapshot(self) -> "Project":
+        """Return a copy for background work that the UI can keep editing."""
+        return snapshot_copy(self, lists=("pages", "assets"))
+
     def to_dict(self) -> dict:
         return {
             "name": self.name,
             "css": self.css,
             "output_dir": self.output_dir,
             "version": self.version,
-            "pages": [asdict(p) for p in self.pages],
+            "pages": [p.to_dict() for p in self.pages],
             "assets": [asset.to_dict() for asset in self.assets],
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Project":
-        pages = [Page(**p) for p in data.get("pages", [])]
+        pages = [Page._adopt(p) for p in data.get("pages", [])]
         assets_data = data.get("assets", [])
         assets: List[Asset] = []
         for asset_data in assets_data:
@@ -1,12 +1,69 @@
-﻿import json
+﻿import io
+import json
 from pathlib import Path
+
+from webineer_common import atomic_write
+
 from .models import Project
 
-def save_project(path: str | Path, project: Project) -> None:
-    path = Path(path)
-    path.write_text(json.dumps(project.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+try:  # pragma: no cover - optional dependency
+    import pybase64 as base64  # type: ignore
+except Exception:  # pragma: no cover - stdlib fallback
+    import base64
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover - JSON only
+    msgpack = None  # type: ignore
+
+# Binary project files start with this tag (shared with MainApp) followed by
+# a msgpack payload that stores asset data as raw bytes under "data".
+# Projects are always saved as JSON; binary files are read when msgpack is
+# available.
+PROJECT_MAGIC = b"WBN2"
+
+def _unpack_asset_data(payload: dict) -> None:
+    for asset in payload.get("assets", ()):
+        if isinstance(asset, dict) and isinstance(asset.get("data"), bytes):
+            asset["data_base64"] = base64.b64encode(asset.pop("data")).decode("ascii")
+
+def _write_project(fh, payload: dict, pretty: bool = True) -> None:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        fh.write(orjson.dumps(payload, option=option))
+        return
+    text = io.TextIOWrapper(fh, encoding="utf-8")
+    if pretty:
+        json.dump(payload, text, indent=2, ensure_ascii=False)
+    else:
+        json.dump(payload, text, separators=(",", ":"), ensure_ascii=False)
+    text.detach()
+
+def save_project(path: str | Path, project: Project, pretty: bool = True) -> None:
+    """Write ``project`` to ``path``.
+
+    JSON output is indented for people reading the file; saves nobody asked
+    for can pass ``pretty=False`` for the smaller, faster compact form.
+    """
+    payload = project.to_dict()
+    # Never leave a truncated project behind if the write fails midway.
+    atomic_write(Path(path), lambda fh: _write_project(fh, payload, pretty), buffering=1 << 17)
 
 def load_project(path: str | Path) -> Project:
     path = Path(path)
-    data = json.loads(path.read_text(encoding="utf-8"))
+    raw = path.read_bytes()
+    if raw.startswith(PROJECT_MAGIC):
+        if msgpack is None:
+            raise ValueError("This project was saved in the binary format; install msgpack to open it.")
+        data = msgpack.unpackb(raw[len(PROJECT_MAGIC):], raw=False)
+        _unpack_asset_data(data)
+    else:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     return Project.from_dict(data)
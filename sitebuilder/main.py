@@ -1,5 +1,5 @@
 ﻿import sys
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtWidgets
 
 from MainApp import set_app_icon
 from .ui.main_window import MainWindow
@@ -13,6 +13,10 @@ if sys.platform == "win32":
 
 
 def main() -> int:
+    # MainWindow imports Qt WebEngine after the application exists, which
+    # requires shared GL contexts to be enabled first.
+    QtCore.QCoreApplication.setAttribute(
+        QtCore.Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QtWidgets.QApplication(sys.argv)
     win = MainWindow()
     set_app_icon(app, win)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import webbrowser
 from typing import cast, Literal
@@ -12,7 +13,8 @@ from pathlib import Path
 from typing import Dict, Optional
 
 from PyQt6 import QtCore, QtGui, QtWidgets
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+from webineer_common import PreviewVisibilityMixin, fits_set_html
 
 from ..core import generator, storage
 from ..core.models import Page, Project
@@ -21,7 +23,31 @@ from ..importers import ALLOWED_EXTS_DEFAULT, ImportOptions, ImportResult, impor
 APP_TITLE = "PyQt Site Builder"
 
 
-class MainWindow(QtWidgets.QMainWindow):
+class _ExportSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(bool, str)
+
+
+class _ExportJob(QtCore.QRunnable):
+    """Render a project snapshot to ``out_dir`` off the GUI thread."""
+
+    def __init__(self, project: Project, out_dir: str, templates_dir: Path,
+                 signals: _ExportSignals) -> None:
+        super().__init__()
+        self.project = project
+        self.out_dir = out_dir
+        self.templates_dir = templates_dir
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            generator.render_site(self.project, self.out_dir, self.templates_dir)
+        except Exception as exc:
+            self.signals.finished.emit(False, str(exc))
+            return
+        self.signals.finished.emit(True, "")
+
+
+class MainWindow(PreviewVisibilityMixin, QtWidgets.QMainWindow):
     _instance = None
 
     def __new__(cls, *args, **kwargs):
@@ -36,12 +62,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.project: Optional[Project] = None
         self.project_path: Optional[Path] = None
-        self._preview_tmp: Optional[str] = None
+        # Removed by closeEvent, or by Qt when the window is destroyed.
+        self._preview_tmp: Optional[QtCore.QTemporaryDir] = None
         self._debounce = QtCore.QTimer(self)
         self._debounce.setInterval(400)
         self._debounce.setSingleShot(True)
-        # Debounced auto-preview: call update_preview when timer fires
-        self._debounce.timeout.connect(self.update_preview)
+        # Debounced auto-preview: refresh when the timer fires and the editors
+        # hold something other than what was last rendered
+        self._debounce.timeout.connect(self._on_preview_debounce)
+        self._last_editor_digest: bytes = b""
+        # Set when a refresh was skipped because the preview could not be
+        # seen; the next show/restore/splitter move catches up.
+        self._preview_stale = False
+        # Exports run here, one at a time, so the window stays responsive.
+        self._export_pool = QtCore.QThreadPool(self)
+        self._export_pool.setMaxThreadCount(1)
 
         self._current_page_index: int = 0
 
@@ -150,6 +185,11 @@ class MainWindow(QtWidgets.QMainWindow):
         preview_controls.addStretch(1)
         right_layout.addLayout(preview_controls)
 
+        # Imported here rather than at module level: loading Qt WebEngine
+        # starts Chromium, which should not happen just by importing this
+        # module. main() enables AA_ShareOpenGLContexts to allow it.
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+
         self.preview = QWebEngineView(right_panel)
         right_layout.addWidget(self.preview, 1)
 
@@ -166,6 +206,7 @@ class MainWindow(QtWidgets.QMainWindow):
         splitter.addWidget(right_panel)
         # slightly wider left column
         splitter.setSizes([260, 560, 520])
+        splitter.splitterMoved.connect(lambda *_: self._resume_preview())
         self.status = self.statusBar()
         # Helpful hover tooltips
         try:
@@ -284,8 +325,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.page_combo.blockSignals(True)
         self.page_combo.clear()
         if self.project and self.project.pages:
-            for page in self.project.pages:
-                self.page_combo.addItem(page.title or page.filename)
+            self.page_combo.addItems(
+                [page.title or page.filename for page in self.project.pages])
         self.page_combo.setCurrentIndex(
             self.pages_list.currentRow() if self.pages_list.currentRow() >= 0 else 0)
         self.page_combo.blockSignals(False)
@@ -354,7 +395,24 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         templates_dir = Path(__file__).resolve(
         ).parent.parent / "core" / "templates"
-        generator.render_site(self.project, out_dir, templates_dir)
+        signals = _ExportSignals(self)
+        signals.finished.connect(
+            lambda ok, error: self._on_site_exported(out_dir, ok, error))
+        signals.finished.connect(signals.deleteLater)
+        self.act_export.setEnabled(False)
+        if self.status is not None:
+            self.status.showMessage("Exporting…")
+        self._export_pool.start(_ExportJob(
+            self.project.snapshot(), out_dir, templates_dir, signals))
+
+    def _on_site_exported(self, out_dir: str, ok: bool, error: str) -> None:
+        self.act_export.setEnabled(True)
+        if not ok:
+            if self.status is not None:
+                self.status.clearMessage()
+            QtWidgets.QMessageBox.critical(
+                self, "Export failed", f"Could not export the site:\n{error}")
+            return
         if self.status is not None:
             self.status.showMessage(f"Exported site to {out_dir}", 5000)
         QtWidgets.QMessageBox.information(
@@ -491,11 +549,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _refresh_pages_list(self, select_index: int = 0) -> None:
         self.pages_list.blockSignals(True)
-        self.pages_list.clear()
-        if self.project:
-            for page in self.project.pages:
-                self.pages_list.addItem(f"{page.title}  ({page.filename})")
-        self.pages_list.blockSignals(False)
+        self.pages_list.setUpdatesEnabled(False)
+        try:
+            self.pages_list.clear()
+            if self.project:
+                self.pages_list.addItems(
+                    [f"{page.title}  ({page.filename})" for page in self.project.pages])
+        finally:
+            self.pages_list.setUpdatesEnabled(True)
+            self.pages_list.blockSignals(False)
 
         count = self.pages_list.count()
         if count == 0:
@@ -508,12 +570,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self._load_page_into_editor(select_index)
 
     def _refresh_assets_list(self) -> None:
-        self.assets_view.clear()
-        if not self.project:
-            return
-        for asset in self.project.assets:
-            item = QtWidgets.QListWidgetItem(f"{asset.kind}: {asset.name}")
-            self.assets_view.addItem(item)
+        self.assets_view.setUpdatesEnabled(False)
+        try:
+            self.assets_view.clear()
+            if self.project:
+                self.assets_view.addItems(
+                    [f"{asset.kind}: {asset.name}" for asset in self.project.assets])
+        finally:
+            self.assets_view.setUpdatesEnabled(True)
 
     def _on_page_selection_changed(self, row: int) -> None:
         if self.project is None or row < 0 or row >= len(self.project.pages):
@@ -537,18 +601,41 @@ class MainWindow(QtWidgets.QMainWindow):
             self.project.pages[row].html = self.html_editor.toPlainText()
         self.project.css = self.css_editor.toPlainText()
 
+    def _editor_digest(self) -> bytes:
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(str(self.pages_list.currentRow()).encode("ascii"))
+        for editor in (self.html_editor, self.css_editor):
+            digest.update(b"\0")
+            digest.update(editor.toPlainText().encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def _on_preview_debounce(self) -> None:
+        if self._editor_digest() == self._last_editor_digest:
+            return
+        self.update_preview()
+
+    def _catch_up_preview(self) -> None:
+        self.update_preview()
+
     def update_preview(self, open_external: bool = False) -> None:
         if self.project is None:
             return
         self._flush_editors_to_model()
+        if not open_external and self._preview_hidden():
+            self._preview_stale = True
+            return
 
-        # rebuild the temporary output
-        if self._preview_tmp and os.path.isdir(self._preview_tmp):
-            shutil.rmtree(self._preview_tmp, ignore_errors=True)
-        self._preview_tmp = tempfile.mkdtemp(prefix="sitebuilder_preview_")
+        # render into one preview directory, reused across refreshes
+        if self._preview_tmp is None or not os.path.isdir(self._preview_tmp.path()):
+            self._preview_tmp = QtCore.QTemporaryDir(os.path.join(
+                QtCore.QDir.tempPath(), "sitebuilder_preview_XXXXXX"))
+            if not self._preview_tmp.isValid():
+                raise OSError(self._preview_tmp.errorString())
+        preview_dir = self._preview_tmp.path()
         templates_dir = Path(__file__).resolve(
         ).parent.parent / "core" / "templates"
-        generator.render_site(self.project, self._preview_tmp, templates_dir)
+        generator.render_site(self.project, preview_dir, templates_dir)
+        self._last_editor_digest = self._editor_digest()
 
         # show the currently selected page
         row = self.pages_list.currentRow()
@@ -556,33 +643,28 @@ class MainWindow(QtWidgets.QMainWindow):
             row = 0
         if 0 <= row < len(self.project.pages):
             page = self.project.pages[row]
-            path = Path(self._preview_tmp) / page.filename
-            self.preview.setUrl(QtCore.QUrl.fromLocalFile(str(path)))
+            path = Path(preview_dir) / page.filename
+            url = QtCore.QUrl.fromLocalFile(str(path))
+            try:
+                html = path.read_text(encoding="utf-8")
+            except OSError:
+                html = ""
+            if html and fits_set_html(html):
+                # One in-memory load; the page URL as base keeps relative
+                # asset links pointing into the preview directory.
+                self.preview.setHtml(html, url)
+            else:
+                self.preview.setUrl(url)
             if open_external:
                 try:
                     webbrowser.open(str(path))
                 except Exception:
                     pass
-            # Nudge the view to avoid an initial white frame on startup.
-            try:
-                self.preview.reload()
-            except Exception:
-                pass
-            QtCore.QTimer.singleShot(150, lambda: getattr(
-                self.preview, 'reload', lambda: None)())
             try:
                 if self.status is not None:
                     self.status.showMessage(f"Preview: {str(path)}", 2500)
             except Exception:
                 pass
-            # Also attempt to load the generated HTML directly into the view
-            try:
-                html = path.read_text(encoding='utf-8')
-                base = QtCore.QUrl.fromLocalFile(
-                    str(path.parent) + os.path.sep)
-                self.preview.setHtml(html, base)
-            except Exception:
-                pass
             try:
                 def _on_load(ok: bool) -> None:
                     if self.status is not None:
@@ -611,8 +693,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle(f"{APP_TITLE} — {name}{suffix}")
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802 (Qt override)
-        if self._preview_tmp and os.path.isdir(self._preview_tmp):
-            shutil.rmtree(self._preview_tmp, ignore_errors=True)
+        self._export_pool.waitForDone()
+        if self._preview_tmp is not None:
+            self._preview_tmp.remove()
         super().closeEvent(event)
 
     # --------------------------------------------------------------- Defaults --
@@ -704,9 +787,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.html_editor.clear()
             return
         page = self.project.pages[index]
-        self.html_editor.blockSignals(True)
-        self.html_editor.setPlainText(page.html)
-        self.html_editor.blockSignals(False)
+        with QtCore.QSignalBlocker(self.html_editor):
+            self.html_editor.setPlainText(page.html)
 
 
 def _show_import_summary(parent: QtWidgets.QWidget, result: ImportResult) -> None:
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import base64
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import webineer_common
+from sitebuilder.core import generator
+from sitebuilder.core.models import Asset, Page, Project
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "sitebuilder" / "core" / "templates"
+
+
+def _project(page_count: int = 3) -> Project:
+    pages = [
+        Page(filename=f"page-{i}.html", title=f"Page {i}", html=f"<p>Body {i}</p>")
+        for i in range(page_count)
+    ]
+    assets = [
+        Asset(name="logo.png", data_base64=base64.b64encode(b"PNG").decode("ascii"), kind="images"),
+        Asset(name="broken.bin", data_base64="!!not base64!!", kind="other"),
+    ]
+    return Project(name="Demo", pages=pages, css="body { color: red; }", assets=assets)
+
+
+def test_render_site_writes_every_page_and_asset(tmp_path: Path) -> None:
+    generator.render_site(_project(), tmp_path, TEMPLATES_DIR)
+    for i in range(3):
+        html = (tmp_path / f"page-{i}.html").read_text(encoding="utf-8")
+        assert f"<p>Body {i}</p>" in html
+        assert "page-2.html" in html  # nav lists every page
+    assert (tmp_path / "assets" / "css" / "style.css").read_text(encoding="utf-8") == "body { color: red; }"
+    assert (tmp_path / "assets" / "images" / "logo.png").read_bytes() == b"PNG"
+    assert not (tmp_path / "assets" / "files" / "broken.bin").exists()
+
+
+def test_base_template_is_compiled_once() -> None:
+    first = generator._base_template(TEMPLATES_DIR)
+    assert generator._base_template(TEMPLATES_DIR) is first
+
+
+def test_render_site_leaves_unchanged_files_alone(tmp_path: Path) -> None:
+    project = _project()
+    generator.render_site(project, tmp_path, TEMPLATES_DIR)
+    page = tmp_path / "page-0.html"
+    css = tmp_path / "assets" / "css" / "style.css"
+    os.utime(page, ns=(0, 0))
+    os.utime(css, ns=(0, 0))
+
+    project.pages[1].html = "<p>Edited</p>"
+    generator.render_site(project, tmp_path, TEMPLATES_DIR)
+
+    assert page.stat().st_mtime_ns == 0
+    assert css.stat().st_mtime_ns == 0
+    assert "<p>Edited</p>" in (tmp_path / "page-1.html").read_text(encoding="utf-8")
+
+
+def test_render_site_skips_decoding_unchanged_assets(tmp_path: Path, monkeypatch) -> None:
+    project = _project()
+    generator.render_site(project, tmp_path, TEMPLATES_DIR)
+    decoded = []
+    real_decode = generator.base64.b64decode
+    monkeypatch.setattr(generator.base64, "b64decode", lambda data: decoded.append(data) or real_decode(data))
+
+    generator.render_site(project, tmp_path, TEMPLATES_DIR)
+    assert decoded == [b"!!not base64!!"]  # only the asset that never got written
+
+    project.assets[0].data_base64 = base64.b64encode(b"GIF").decode("ascii")
+    generator.render_site(project, tmp_path, TEMPLATES_DIR)
+    assert (tmp_path / "assets" / "images" / "logo.png").read_bytes() == b"GIF"
+
+
+def test_asset_write_cache_is_bounded(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(webineer_common, "ASSET_WRITE_CACHE_SIZE", 2)
+    monkeypatch.setattr(webineer_common, "_ASSET_WRITE_CACHE", webineer_common.OrderedDict())
+    project = _project()
+    project.assets = [
+        Asset(name=f"img-{i}.png", data_base64=base64.b64encode(b"PNG%d" % i).decode("ascii"), kind="images")
+        for i in range(5)
+    ]
+    generator.render_site(project, tmp_path, TEMPLATES_DIR)
+    assert len(webineer_common._ASSET_WRITE_CACHE) == 2
+    for i in range(5):
+        assert (tmp_path / "assets" / "images" / f"img-{i}.png").read_bytes() == b"PNG%d" % i
+
+
+def test_render_site_reports_asset_write_errors(tmp_path: Path) -> None:
+    (tmp_path / "assets" / "images" / "logo.png").mkdir(parents=True)
+    with pytest.raises(OSError):
+        generator.render_site(_project(), tmp_path, TEMPLATES_DIR)
+
+
+def test_render_template_matches_template_render() -> None:
+    tpl = generator._base_template(TEMPLATES_DIR)
+    variables = {
+        "site_name": "Demo & Co",
+        "pages": [{"filename": "index.html", "title": "Home"}],
+        "stylesheet_path": "assets/css/style.css",
+        "title": "Home",
+        "content": "<p>Hi</p>",
+    }
+    assert webineer_common.render_template(tpl, variables) == tpl.render(**variables)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import base64
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from sitebuilder.core.models import Project
 from sitebuilder.importers import (
+    ImportOptions,
     extract_html_title_and_body,
     rewrite_css_urls,
     rewrite_html_links,
     slugify_filename,
     detect_likely_html_strings_in_py,
+    import_into_project,
 )
 
 
@@ -55,3 +59,15 @@ def test_detect_likely_html_strings_in_py_finds_triple_quotes() -> None:
     assert score > 0
     assert "<p>Hello</p>" in snippet
 
+
+def test_import_dedupes_identical_assets(tmp_path: Path) -> None:
+    source = tmp_path / "site"
+    source.mkdir()
+    (source / "a.png").write_bytes(b"same")
+    (source / "b.png").write_bytes(b"same")
+    (source / "c.png").write_bytes(b"other")
+    project = Project(name="Demo", pages=[], css="")
+    result = import_into_project(project, source, ImportOptions())
+    assert result.assets_copied == 2
+    contents = sorted(base64.b64decode(asset.data_base64) for asset in project.assets)
+    assert contents == [b"other", b"same"]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sitebuilder.core import storage
+from sitebuilder.core.models import Asset, Page, Project
+
+
+def test_save_and_load_project_round_trip(tmp_path: Path) -> None:
+    project = Project(
+        name="Café",
+        pages=[Page(filename="index.html", title="Accueil", html="<p>Bonjour – monde</p>")],
+        css="body { margin: 0; }",
+        assets=[Asset(name="logo.png", data_base64="UE5H", kind="images")],
+    )
+    path = tmp_path / "site.json"
+    storage.save_project(path, project)
+    assert "Café" in path.read_text(encoding="utf-8")
+
+    loaded = storage.load_project(path)
+    assert loaded.to_dict() == project.to_dict()
+
+
+def test_compact_save_round_trips(tmp_path: Path) -> None:
+    project = Project(name="Demo", pages=[Page(filename="index.html", title="Home", html="<p>Hi</p>")], css="")
+    pretty = tmp_path / "pretty.json"
+    compact = tmp_path / "compact.json"
+    storage.save_project(pretty, project)
+    storage.save_project(compact, project, pretty=False)
+    assert b"\n" not in compact.read_bytes()
+    assert compact.stat().st_size < pretty.stat().st_size
+    assert storage.load_project(compact).to_dict() == project.to_dict()
+
+
+def test_failed_save_keeps_previous_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "site.siteproj"
+    storage.save_project(path, Project(name="First", pages=[], css=""))
+    before = path.read_bytes()
+
+    def boom(fh, payload, pretty=True):
+        fh.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage, "_write_project", boom)
+    with pytest.raises(OSError):
+        storage.save_project(path, Project(name="Second", pages=[], css=""))
+    assert path.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["site.siteproj"]
+
+
+def test_load_project_reads_plain_json(tmp_path: Path) -> None:
+    path = tmp_path / "legacy.siteproj"
+    path.write_text(
+        '{"name": "Old", "css": "", "pages": [{"filename": "index.html", "title": "Home", "html": ""}]}',
+        encoding="utf-8",
+    )
+    loaded = storage.load_project(path)
+    assert loaded.name == "Old"
+    assert loaded.pages[0].filename == "index.html"
+
+
+def test_binary_project_without_msgpack_is_reported(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(storage, "msgpack", None)
+    path = tmp_path / "binary.siteproj"
+    path.write_bytes(storage.PROJECT_MAGIC + b"\x80")
+    with pytest.raises(ValueError, match="msgpack"):
+        storage.load_project(path)
+
+
+def test_save_writes_json_even_when_msgpack_is_available(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class UnusedMsgpack:
+        @staticmethod
+        def packb(*args, **kwargs):
+            raise AssertionError("binary format written without being asked for")
+
+    monkeypatch.setattr(storage, "msgpack", UnusedMsgpack)
+    path = tmp_path / "site.siteproj"
+    storage.save_project(path, Project(name="Demo", pages=[], css=""))
+    assert not path.read_bytes().startswith(storage.PROJECT_MAGIC)
+    assert storage.load_project(path).name == "Demo"
+
+
+def test_load_reads_binary_files(tmp_path: Path) -> None:
+    msgpack = pytest.importorskip("msgpack")
+    project = Project(
+        name="Demo",
+        pages=[Page(filename="index.html", title="Home", html="<p>Hi</p>")],
+        css="body { margin: 0; }",
+        assets=[
+            Asset(name="logo.png", data_base64="UE5H", kind="images"),
+            Asset(name="broken.bin", data_base64="!!not base64!!", kind="other"),
+        ],
+    )
+    payload = project.to_dict()
+    payload["assets"][0] = {"name": "logo.png", "data": b"PNG", "kind": "images"}
+    path = tmp_path / "site.siteproj"
+    path.write_bytes(storage.PROJECT_MAGIC + msgpack.packb(payload, use_bin_type=True))
+    assert storage.load_project(path).to_dict() == project.to_dict()
+
+
+def test_from_dict_adopts_well_formed_pages_and_validates_others() -> None:
+    good = {"filename": "index.html", "title": "Home", "html": "<p>Hi</p>"}
+    partial = {"filename": "about.html", "title": "About"}
+    project = Project.from_dict({"name": "Demo", "css": "", "pages": [good, partial]})
+    assert project.pages[0] == Page(filename="index.html", title="Home", html="<p>Hi</p>")
+    assert project.pages[1] == Page(filename="about.html", title="About", html="")
+
+
+def test_snapshot_copies_pages_but_shares_strings() -> None:
+    project = Project(name="Demo", pages=[Page("index.html", "Home", "<p>Hi</p>")], css="")
+    snapshot = project.snapshot()
+    project.pages[0].html = "<p>Edited</p>"
+    project.pages.append(Page("about.html", "About", ""))
+    assert [page.html for page in snapshot.pages] == ["<p>Hi</p>"]
+    assert snapshot.css is project.css
@@ -0,0 +1,226 @@
+"""Helpers shared by MainApp and the sitebuilder package.
+
+Nothing here imports Qt, so sitebuilder's core modules (and their tests)
+can use it without a GUI stack installed.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Optional, TypeVar
+
+try:  # pragma: no cover - optional dependency
+    import pybase64 as base64  # type: ignore
+except Exception:  # pragma: no cover - stdlib fallback
+    import base64
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+T = TypeVar("T")
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+
+def atomic_write(path: Path, write: Callable[[BinaryIO], None],
+                 buffering: int = -1) -> None:
+    """Call ``write`` with a file beside ``path``, then rename it over ``path``.
+
+    A crash or error mid-write never leaves a truncated file behind: the
+    partial temp file is removed and the exception re-raised.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb", buffering=buffering) as fh:
+            write(fh)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def content_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def write_if_changed(path: Path, data: bytes,
+                     digest: Optional[bytes] = None) -> bool:
+    """Write ``data`` to ``path`` unless the file already holds those bytes.
+
+    Returns ``True`` when the file was written. Leaving unchanged files alone
+    keeps their mtimes stable, so previews and file watchers see no churn.
+    Constant payloads pass their precomputed ``digest``.
+    """
+    try:
+        if path.stat().st_size == len(data):
+            if digest is None:
+                digest = content_digest(data)
+            if content_digest(path.read_bytes()) == digest:
+                return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+# target path -> (base64 source string, st_mtime_ns, st_size) of the last
+# write. Holding the source string keeps its identity check meaningful; the
+# least recently used targets are dropped past ASSET_WRITE_CACHE_SIZE so old
+# export and preview directories and deleted assets do not stay pinned.
+ASSET_WRITE_CACHE_SIZE = 256
+_ASSET_WRITE_CACHE: OrderedDict[Path, tuple[str, int, int]] = OrderedDict()
+_ASSET_WRITE_LOCK = threading.Lock()
+
+
+def asset_write_is_current(path: Path, data_base64: str) -> bool:
+    """True when ``path`` still holds what ``data_base64`` last decoded to.
+
+    Project snapshots share their base64 strings with the live project, so
+    an unchanged asset is recognised by identity plus the target's stat
+    without decoding or re-reading it.
+    """
+    with _ASSET_WRITE_LOCK:
+        cached = _ASSET_WRITE_CACHE.get(path)
+        if cached is not None:
+            _ASSET_WRITE_CACHE.move_to_end(path)
+    if cached is None or cached[0] is not data_base64:
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return (st.st_mtime_ns, st.st_size) == cached[1:]
+
+
+def remember_asset_write(path: Path, data_base64: str) -> None:
+    st = path.stat()
+    with _ASSET_WRITE_LOCK:
+        _ASSET_WRITE_CACHE[path] = (data_base64, st.st_mtime_ns, st.st_size)
+        _ASSET_WRITE_CACHE.move_to_end(path)
+        while len(_ASSET_WRITE_CACHE) > ASSET_WRITE_CACHE_SIZE:
+            _ASSET_WRITE_CACHE.popitem(last=False)
+
+
+def write_base64_asset(path: Path, data_base64: str) -> None:
+    """Decode ``data_base64`` into ``path`` unless it was already written."""
+    if asset_write_is_current(path, data_base64):
+        return
+    write_if_changed(path, base64.b64decode(data_base64.encode("ascii")))
+    remember_asset_write(path, data_base64)
+
+
+# ---------------------------------------------------------------------------
+# Rendering and preview
+# ---------------------------------------------------------------------------
+
+
+def render_template(template: Template, variables: dict[str, Any]) -> str:
+    """Render ``template`` from a prepared variables dict.
+
+    Goes straight to ``root_render_func`` so each page skips the kwargs merge
+    in ``Template.render``; errors still get Jinja's traceback rewriting.
+    """
+    try:
+        return template.environment.concat(  # type: ignore[attr-defined]
+            template.root_render_func(template.new_context(variables)))
+    except Exception:
+        return template.environment.handle_exception()
+
+
+# QWebEngineView.setHtml goes through a data: URL, which is capped at 2 MB.
+# The URL holds the percent-encoded UTF-8, so each byte can take up to three
+# characters of it.
+PREVIEW_DATA_URL_LIMIT = 2_000_000
+
+
+def fits_set_html(html: str) -> bool:
+    """True when ``html`` is small enough to load with setHtml."""
+    return len(html.encode("utf-8")) * 3 < PREVIEW_DATA_URL_LIMIT
+
+
+class PreviewVisibilityMixin:
+    """Defers preview renders while the preview pane cannot be seen.
+
+    Mix in ahead of the Qt window class. The window provides ``preview``,
+    a ``_preview_stale`` flag its ``update_preview`` sets instead of
+    rendering while ``_preview_hidden()``, and ``_catch_up_preview()``,
+    which re-renders once the pane is visible again.
+    """
+
+    preview: Any
+    _preview_stale: bool
+
+    def _catch_up_preview(self) -> None:
+        raise NotImplementedError
+
+    def _preview_hidden(self) -> bool:
+        """True while the preview pane cannot be seen (minimized, collapsed)."""
+        return (self.isMinimized() or not self.preview.isVisible()  # type: ignore[attr-defined]
+                or self.preview.width() == 0)
+
+    def _resume_preview(self) -> None:
+        if self._preview_stale and not self._preview_hidden():
+            self._preview_stale = False
+            self._catch_up_preview()
+
+    def showEvent(self, event: Any) -> None:  # noqa: N802 (Qt override)
+        super().showEvent(event)  # type: ignore[misc]
+        self._resume_preview()
+
+    def changeEvent(self, event: Any) -> None:  # noqa: N802 (Qt override)
+        super().changeEvent(event)  # type: ignore[misc]
+        if event.type() == event.Type.WindowStateChange:
+            self._resume_preview()
+
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in dataclasses.fields(cls))
+
+
+def adopt_str_fields(cls: type[T], data: dict) -> Optional[T]:
+    """Build a ``cls`` dataclass that takes ownership of a freshly parsed dict.
+
+    A dict holding exactly the dataclass's fields, all as ``str``, becomes
+    the instance ``__dict__`` directly, with no ``__init__`` call or copy.
+    Anything else returns ``None`` for the caller's validating path. Only
+    pass dicts nobody else holds on to.
+    """
+    if data.keys() == _field_names(cls) and all(
+            type(value) is str for value in data.values()):
+        obj = object.__new__(cls)
+        obj.__dict__ = data
+        return obj
+    return None
+
+
+def snapshot_copy(obj: T, lists: Iterable[str] = (),
+                  dicts: Iterable[str] = ()) -> T:
+    """Return a copy of ``obj`` for background work the UI can keep editing.
+
+    The named list attributes are copied along with the objects in them,
+    and the named dict attributes are copied. The strings they hold (page
+    HTML, base64 assets) are immutable and shared, so the cost grows with
+    the number of items rather than their size.
+    """
+    clone = copy.copy(obj)
+    for name in lists:
+        setattr(clone, name, [copy.copy(item) for item in getattr(obj, name)])
+    for name in dicts:
+        setattr(clone, name, dict(getattr(obj, name)))
+    return clone